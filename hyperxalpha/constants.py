@@ -5,6 +5,7 @@ PRODUCT_ID = 0x098D
 COMPATIBLE_MODELS = {
     (0x03F0, 0x098D): "HyperX Cloud Alpha Wireless",
 }
+COMPATIBLE_IDS = frozenset(COMPATIBLE_MODELS)
 
 
 class Command(IntEnum):
@@ -25,6 +26,15 @@ class Command(IntEnum):
     SLEEP_TIMER_30 = 0x21BB121E
 
 
+def _encode_command(cmd):
+    return int(cmd).to_bytes(4, "big")
+
+
+for _command in Command:
+    _command.payload = _encode_command(_command)
+del _command
+
+
 class ConnectionStatus(IntEnum):
     DISCONNECTED = 0
     CONNECTED = 1
@@ -1,10 +1,11 @@
+import dataclasses
+import functools
 import os
 import queue
 import sys
 import threading
 import time
 from collections import deque
-from datetime import datetime
 from pathlib import Path
 
 try:
@@ -15,7 +16,13 @@ except ImportError as exc:
 from . import APP_NAME, app_display_name
 from .constants import Command, ConnectionStatus
 from .device import HidIoError, HidUnavailable
-from .device_service import DeviceOpenSignals, DeviceReader, DeviceService
+from .device_service import (
+    DeviceOpenSignals,
+    DeviceReader,
+    DeviceReaderThread,
+    DeviceService,
+    UdevWatcher,
+)
 from .settings_service import SettingsService
 from .view import HyperxViewMixin, LogDialog
 
@@ -25,13 +32,19 @@ POLL_INTERVAL_DISCONNECTED_MS = 5000
 POLL_INTERVAL_CONNECTED_MS = 30000
 MIC_STATE_PROBE_TIMEOUT_MS = 1200
 DEVICE_HOTPLUG_INTERVAL_MS = 2500
-CONNECTION_NOTIFY_DEBOUNCE_MS = 1800
-BATTERY_NOTIFY_DEBOUNCE_MS = 1800
+UDEV_SETTLE_DELAY_MS = 400
+NOTIFY_DEBOUNCE_MS = 1800
+NOTIFY_FLUSH_BATTERY = 1
+NOTIFY_FLUSH_CONNECTION = 2
+CONNECTION_EVENT_RING_SIZE = 16
 TRANSIENT_TX_FAILURE_LIMIT = 2
 TX_TIMEOUT_BACKOFF_INITIAL_MS = 4000
 TX_TIMEOUT_BACKOFF_MAX_MS = 60000
 TX_QUEUE_MAX_PENDING = 64
 LOG_DIALOG_FLUSH_INTERVAL_MS = 120
+TRAY_REFRESH_INTERVAL_MS = 100
+SETTINGS_FLUSH_DELAY_MS = 500
+SETTINGS_SAVE_MAX_ATTEMPTS = 3
 TX_TIMEOUT_LOG_MIN_INTERVAL_SECONDS = 20.0
 TX_QUEUE_FULL_LOG_MIN_INTERVAL_SECONDS = 4.0
 LOG_LEVEL_INFO = "INFO"
@@ -47,12 +60,75 @@ TX_TIMEOUT_ERROR_MARKERS = (
     "would block",
     "resource busy",
 )
+TRAY_ICON_NAMES = ("traydc", "tray0", "tray20", "tray40", "tray60", "tray80", "tray100")
+BATTERY_NOTIFY_THRESHOLDS = (20, 10, 5)
+_BATTERY_THRESHOLD_INDEX = {
+    level: index for index, level in enumerate(BATTERY_NOTIFY_THRESHOLDS)
+}
+PACKET_HEADER = b"\x21\xbb"
+TOOLTIP_BUSY = "Headset detected (control channel busy)"
+TOOLTIP_CONNECTED = "Connected"
+TOOLTIP_DISCONNECTED = "Power Off"
+_BATTERY_TOOLTIPS = tuple(
+    f"{level * 3} Hours Remaining ({level}%)" for level in range(101)
+)
+
+
+def _battery_icon_bucket(level):
+    return min(6, (level + 9) // 20 + 1)
+
+
+def _battery_notify_threshold(level):
+    threshold = None
+    for candidate in BATTERY_NOTIFY_THRESHOLDS:
+        if level <= candidate:
+            threshold = candidate
+    return threshold
+
+
+def _battery_reached_mask(level):
+    mask = 0
+    for index, candidate in enumerate(BATTERY_NOTIFY_THRESHOLDS):
+        if level <= candidate:
+            mask |= 1 << index
+    return mask
+
+
+_BATTERY_LUT = tuple(
+    (
+        _battery_icon_bucket(level),
+        _battery_notify_threshold(level),
+        _battery_reached_mask(level),
+    )
+    for level in range(101)
+)
+
+
+def _requires_connected(handler):
+    @functools.wraps(handler)
+    def wrapper(self, value):
+        if self.status != ConnectionStatus.CONNECTED:
+            return None
+        return handler(self, value)
+
+    return wrapper
+
+
+@dataclasses.dataclass(slots=True)
+class PendingBatteryNotification:
+    threshold: int
+    battery: int
+    count: int = 1
 
 
 class DeviceTxSignals(QtCore.QObject):
     completed = QtCore.Signal(int, str, bool, bool, str)
 
 
+class SettingsSaveSignals(QtCore.QObject):
+    finished = QtCore.Signal(bool, object)
+
+
 class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
     def __init__(self, start_hidden=False, use_tray=True):
         super().__init__()
@@ -99,6 +175,16 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._mic_state_probe_timer.setInterval(MIC_STATE_PROBE_TIMEOUT_MS)
         self._mic_state_probe_timer.timeout.connect(self._on_mic_state_probe_timeout)
         self._mic_state_reported = False
+        self._settings_pending = None
+        self._settings_save_attempts = 0
+        self._settings_save_lock = threading.Lock()
+        self._settings_save_thread = None
+        self._settings_save_signals = SettingsSaveSignals(self)
+        self._settings_save_signals.finished.connect(self._on_settings_saved)
+        self._settings_flush_timer = QtCore.QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(SETTINGS_FLUSH_DELAY_MS)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
 
         self._updating_controls = False
         self._updating_settings = False
@@ -110,10 +196,20 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._device_hotplug_timer = QtCore.QTimer(self)
         self._device_hotplug_timer.setInterval(DEVICE_HOTPLUG_INTERVAL_MS)
         self._device_hotplug_timer.timeout.connect(self._poll_device_hotplug)
+        self._udev_settle_timer = QtCore.QTimer(self)
+        self._udev_settle_timer.setSingleShot(True)
+        self._udev_settle_timer.setInterval(UDEV_SETTLE_DELAY_MS)
+        self._udev_settle_timer.timeout.connect(self._on_udev_settled)
+        self._udev_watcher = UdevWatcher(self)
+        self._udev_watcher.device_added.connect(self._on_udev_device_event)
+        self._udev_watcher.device_removed.connect(self._on_udev_device_event)
+        self._udev_watcher.events_lost.connect(self._on_udev_device_event)
+        self._udev_watcher.failed.connect(self._on_udev_watcher_failed)
 
         self.status = ConnectionStatus.DISCONNECTED
         self.battery = None
-        self._battery_notified_levels = set()
+        self._battery_notified_mask = 0
+        self._last_notified_battery = None
 
         self._tray_available = False
         self._tray = None
@@ -123,28 +219,31 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._tray_mic_action = None
         self._tray_sleep_actions = {}
         self._updating_tray_controls = False
-        self._tray_icons = {}
+        self._tray_icons_by_bucket = (None,) * len(TRAY_ICON_NAMES)
+        self._last_tray_state = None
+        self._tray_refresh_timer = QtCore.QTimer(self)
+        self._tray_refresh_timer.setSingleShot(True)
+        self._tray_refresh_timer.setInterval(TRAY_REFRESH_INTERVAL_MS)
+        self._tray_refresh_timer.timeout.connect(self._refresh_tray_icon)
+
+        self._pending_flush_flags = 0
+        self._notify_timer = QtCore.QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(NOTIFY_DEBOUNCE_MS)
+        self._notify_timer.timeout.connect(self._flush_notifications)
 
-        self._connection_notify_timer = QtCore.QTimer(self)
-        self._connection_notify_timer.setSingleShot(True)
-        self._connection_notify_timer.setInterval(CONNECTION_NOTIFY_DEBOUNCE_MS)
-        self._connection_notify_timer.timeout.connect(
-            self._flush_connection_notification
-        )
         self._pending_connection_notification = None
-        self._connection_notification_events = deque()
+        self._connection_event_times = [float("-inf")] * CONNECTION_EVENT_RING_SIZE
+        self._connection_event_index = 0
         self._connection_event_window_seconds = 20.0
 
-        self._battery_notify_timer = QtCore.QTimer(self)
-        self._battery_notify_timer.setSingleShot(True)
-        self._battery_notify_timer.setInterval(BATTERY_NOTIFY_DEBOUNCE_MS)
-        self._battery_notify_timer.timeout.connect(self._flush_battery_notification)
         self._pending_battery_notification = None
         self._battery_notification_cooldown_seconds = 900.0
-        self._battery_notification_last_sent = {}
+        self._battery_threshold_ready_at = [0.0] * len(BATTERY_NOTIFY_THRESHOLDS)
 
         self._log_buffer_max = 1000
         self._log_entries = deque(maxlen=self._log_buffer_max)
+        self._log_ts_cache = (0, "")
         self._log_dialog = None
         self._log_pending_entries = deque()
         self._log_dialog_snapshot_needed = False
@@ -157,35 +256,35 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._verbose_io_logs = os.environ.get("HYPERX_DEBUG_IO", "0") == "1"
         self._stdout_logs = os.environ.get("HYPERX_LOG_STDOUT", "0") == "1"
 
+        self._app = QtWidgets.QApplication.instance()
+        self._style_hints = None
+        self._ui_ready = False
         self._theme_is_dark = False
-        self._packet_handlers = {
-            0x03: self._handle_connection_state_packet,
-            0x07: self._handle_sleep_state_packet,
-            0x09: self._handle_voice_state_packet,
-            0x0A: self._handle_mic_monitor_state_packet,
-            0x0B: self._handle_battery_state_packet,
-            0x12: self._handle_sleep_state_packet,
-            0x13: self._handle_voice_state_packet,
-            0x22: self._handle_mic_monitor_feedback_packet,
-            0x24: self._handle_connection_state_packet,
-        }
-
         self.settings = self._settings_service.load()
+        self._tray_notifications_enabled = bool(self.settings.tray_notifications)
+        self._notifications_active = False
         autostart_active = self._settings_service.autostart_enabled()
         if self.settings.start_on_login != autostart_active:
-            self.settings.start_on_login = autostart_active
-            self._settings_service.save(self.settings)
+            self.settings = dataclasses.replace(
+                self.settings, start_on_login=autostart_active
+            )
+            self._save_settings_now()
 
         self._start_tx_worker()
+        self._install_app_theme()
         self._build_ui()
         self._refresh_device_list(preferred_key=self.settings.selected_device_key)
         self._apply_selected_device(reconnect=False)
         self._apply_theme()
-        self._device_hotplug_timer.start()
+        if self._udev_watcher.start():
+            self._device_service.enable_device_cache()
+        else:
+            self._device_hotplug_timer.start()
 
         if use_tray and QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
             self._tray_available = True
             self._init_tray()
+        self._refresh_notifications_active()
         self._configure_minimize_action()
 
         if start_hidden and self._tray_available:
@@ -215,7 +314,10 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
     def _log(self, message, level=LOG_LEVEL_INFO):
         level = self._normalize_log_level(level)
         text = str(message)
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        now = int(time.time())
+        if now != self._log_ts_cache[0]:
+            self._log_ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        timestamp = self._log_ts_cache[1]
         line = f"[{timestamp}] [{level}] {text}"
         buffer_was_full = len(self._log_entries) >= self._log_buffer_max
         self._log_entries.append(
@@ -298,7 +400,7 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         return False
 
     def _format_packet(self, data):
-        return " ".join(f"{byte:02X}" for byte in data)
+        return data.hex(" ").upper()
 
     def _start_tx_worker(self):
         worker = self._tx_worker
@@ -529,9 +631,18 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             io_error=(str(error_message) or None),
         )
 
-    def _send_command(self, cmd, label=None, allow_transient_failure=False):
+    @staticmethod
+    def _raw_command_identity(cmd, label=None):
         command_value = int(cmd)
         command_name = getattr(cmd, "name", None) or label or f"CMD_0x{command_value:08X}"
+        return command_value, command_name
+
+    def _send_command(self, cmd, label=None, allow_transient_failure=False):
+        if type(cmd) is Command:
+            command_value = cmd.value
+            command_name = cmd.name
+        else:
+            command_value, command_name = HyperxWindow._raw_command_identity(cmd, label)
         if not self._device_ready:
             if self._verbose_io_logs:
                 HyperxWindow._emit_log(
@@ -582,13 +693,94 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             )
             return False
 
+    def _mark_settings_dirty(self):
+        self._settings_pending = self.settings
+        self._settings_save_attempts = 0
+        self._settings_flush_timer.start(SETTINGS_FLUSH_DELAY_MS)
+
+    def _save_settings_now(self):
+        self._settings_flush_timer.stop()
+        pending = self._settings_pending
+        with self._settings_save_lock:
+            saved = bool(self._settings_service.save(self.settings))
+            if saved:
+                self._settings_pending = None
+        if not saved and pending is not None:
+            self._mark_settings_dirty()
+        return saved
+
+    def _flush_settings(self):
+        snapshot = self._settings_pending
+        if snapshot is None:
+            return
+        worker = self._settings_save_thread
+        if worker is not None and worker.is_alive():
+            self._settings_flush_timer.start()
+            return
+        self._settings_save_thread = threading.Thread(
+            target=self._settings_save_worker,
+            args=(snapshot,),
+            daemon=True,
+            name="hyperxalpha-settings-save",
+        )
+        self._settings_save_thread.start()
+
+    def _settings_save_worker(self, snapshot):
+        try:
+            with self._settings_save_lock:
+                # Skip snapshots superseded by a newer change or a synchronous save.
+                saved = snapshot is not self._settings_pending or bool(
+                    self._settings_service.save(snapshot)
+                )
+        except Exception:
+            saved = False
+        self._settings_save_signals.finished.emit(saved, snapshot)
+
+    def _on_settings_saved(self, saved, snapshot):
+        self._settings_save_thread = None
+        if self._shutting_down or snapshot is not self._settings_pending:
+            return
+        if saved:
+            self._settings_pending = None
+            return
+        self._settings_save_attempts += 1
+        if self._settings_save_attempts < SETTINGS_SAVE_MAX_ATTEMPTS:
+            self._settings_flush_timer.start(
+                SETTINGS_FLUSH_DELAY_MS << self._settings_save_attempts
+            )
+            return
+        self._log(
+            "Unable to persist preferences; will retry after the next change.",
+            level=LOG_LEVEL_WARN,
+        )
+        saved_key = self._settings_service.load().selected_device_key
+        if self.settings.selected_device_key != saved_key:
+            self._rollback_device_selection(saved_key)
+            self._show_error("Settings Error", "Unable to save selected headset.")
+
+    def _rollback_device_selection(self, previous_key):
+        self.settings = dataclasses.replace(
+            self.settings, selected_device_key=previous_key
+        )
+        rollback_index = self.device_combo.findData(previous_key)
+        if rollback_index >= 0:
+            self._updating_device_selection = True
+            self.device_combo.setCurrentIndex(rollback_index)
+            self._updating_device_selection = False
+            self._selected_device_key = self.device_combo.currentData()
+        else:
+            self._selected_device_key = previous_key
+        self._apply_selected_device(reconnect=True)
+
     def _show_logs(self):
+        self._log_flush_timer.stop()
         if self._log_dialog is None:
             self._log_dialog = LogDialog(self)
-        self._log_flush_timer.stop()
-        self._log_pending_entries.clear()
-        self._log_dialog_snapshot_needed = False
-        self._log_dialog.set_entries(list(self._log_entries))
+            self._log_pending_entries.clear()
+            self._log_dialog_snapshot_needed = False
+            self._log_dialog.set_entries(list(self._log_entries))
+        else:
+            self._flush_log_dialog_updates()
         self._log_dialog.show()
         self._log_dialog.raise_()
 
@@ -597,6 +789,7 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         QtWidgets.QMessageBox.critical(self, title, message)
 
     def _on_scan_devices(self):
+        self._device_service.invalidate_device_cache()
         preferred = self.device_combo.currentData()
         self._refresh_device_list(preferred_key=preferred)
         self._apply_selected_device(reconnect=True)
@@ -641,39 +834,62 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
 
         saved_key = self.settings.selected_device_key
         fallback_from_saved_key = False
+        previous_by_key = self._device_by_key
         self._device_by_key = {item.key: item for item in devices}
         self._updating_device_selection = True
-        self.device_combo.clear()
-        if not devices:
-            self.device_combo.addItem("No compatible headset found", None)
-            self.device_combo.setEnabled(False)
-            selected_key = None
-        else:
-            for item in devices:
-                self.device_combo.addItem(item.display_name(), item.key)
-            self.device_combo.setEnabled(True)
-            target_key = (
-                preferred_key
-                or saved_key
-                or (devices[0].key if devices else None)
-            )
-            index = self.device_combo.findData(target_key)
-            if index < 0:
-                fallback_from_saved_key = bool(saved_key) and target_key == saved_key
-                index = 0
-            self.device_combo.setCurrentIndex(index)
-            selected_key = self.device_combo.currentData()
-        self._updating_device_selection = False
+        self.device_combo.blockSignals(True)
+        try:
+            if not devices:
+                self.device_combo.clear()
+                self.device_combo.addItem("No compatible headset found", None)
+                self.device_combo.setEnabled(False)
+                selected_key = None
+            else:
+                if not previous_by_key:
+                    self.device_combo.clear()
+                self._sync_device_combo_items(previous_by_key, devices)
+                self.device_combo.setEnabled(True)
+                target_key = (
+                    preferred_key
+                    or saved_key
+                    or (devices[0].key if devices else None)
+                )
+                index = self.device_combo.findData(target_key)
+                if index < 0:
+                    fallback_from_saved_key = bool(saved_key) and target_key == saved_key
+                    index = 0
+                if self.device_combo.currentIndex() != index:
+                    self.device_combo.setCurrentIndex(index)
+                selected_key = self.device_combo.currentData()
+        finally:
+            self.device_combo.blockSignals(False)
+            self._updating_device_selection = False
         self._selected_device_key = selected_key
         if (
             fallback_from_saved_key
             and selected_key is not None
             and selected_key != saved_key
         ):
-            self.settings.selected_device_key = selected_key
-            if not self._settings_service.save(self.settings):
-                self.settings.selected_device_key = saved_key
-                self._log("Unable to persist fallback headset selection.")
+            self.settings = dataclasses.replace(
+                self.settings, selected_device_key=selected_key
+            )
+            self._mark_settings_dirty()
+
+    def _sync_device_combo_items(self, previous_by_key, devices):
+        combo = self.device_combo
+        for key in previous_by_key.keys() - self._device_by_key.keys():
+            index = combo.findData(key)
+            if index >= 0:
+                combo.removeItem(index)
+        for index, item in enumerate(devices):
+            if combo.itemData(index) == item.key:
+                if previous_by_key.get(item.key) != item:
+                    combo.setItemText(index, item.display_name())
+                continue
+            existing = combo.findData(item.key)
+            if existing >= 0:
+                combo.removeItem(existing)
+            combo.insertItem(index, item.display_name(), item.key)
 
     def _refresh_device_list(self, preferred_key=None):
         devices, _error = self._list_compatible_devices(log_failures=True)
@@ -711,6 +927,27 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         if self._selected_device_key != previous_selected_key:
             self._apply_selected_device(reconnect=True)
 
+    def _on_udev_device_event(self, _device_path=None):
+        if self._shutting_down:
+            return
+        self._device_service.invalidate_device_cache()
+        self._udev_settle_timer.start()
+
+    def _on_udev_watcher_failed(self, message):
+        if self._shutting_down:
+            return
+        self._log(
+            f"Hotplug monitor stopped ({message}); polling for devices.",
+            level=LOG_LEVEL_WARN,
+        )
+        self._device_service.disable_device_cache()
+        self._device_hotplug_timer.start()
+
+    def _on_udev_settled(self):
+        self._poll_device_hotplug()
+        if not self._device_ready and self._open_retry_timer.isActive():
+            self._start_device_open()
+
     def _on_device_selection_changed(self, _index):
         if self._updating_device_selection:
             return
@@ -720,19 +957,10 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             self._selected_device_key = selected_key
             return
         self._selected_device_key = selected_key
-        self.settings.selected_device_key = selected_key
-        if not self._settings_service.save(self.settings):
-            self.settings.selected_device_key = previous_runtime_key
-            rollback_index = self.device_combo.findData(previous_runtime_key)
-            if rollback_index >= 0:
-                self._updating_device_selection = True
-                self.device_combo.setCurrentIndex(rollback_index)
-                self._updating_device_selection = False
-                self._selected_device_key = self.device_combo.currentData()
-            else:
-                self._selected_device_key = previous_runtime_key
-            self._show_error("Settings Error", "Unable to save selected headset.")
-            return
+        self.settings = dataclasses.replace(
+            self.settings, selected_device_key=selected_key
+        )
+        self._mark_settings_dirty()
         self._apply_selected_device(reconnect=True)
 
     def _apply_selected_device(self, reconnect=False):
@@ -806,14 +1034,20 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._clear_tx_timeout_backoff()
         self._open_retry_timer.stop()
         self._log("Device opened.")
-        self._reader = DeviceReader(
-            self._device_service,
-            read_timeout_ms=self._reader_timeout_ms,
-            parent=self,
-        )
-        self._reader.packet_received.connect(self._handle_packet)
-        self._reader.io_failed.connect(self._on_reader_io_failed)
-        self._reader.start()
+        reader = DeviceReader(self._device_service, parent=self)
+        reader.packet_received.connect(self._handle_packet)
+        reader.io_failed.connect(self._on_reader_io_failed)
+        if not reader.start():
+            reader.deleteLater()
+            reader = DeviceReaderThread(
+                self._device_service,
+                read_timeout_ms=self._reader_timeout_ms,
+                parent=self,
+            )
+            reader.packet_received.connect(self._handle_packet)
+            reader.io_failed.connect(self._on_reader_io_failed)
+            reader.start()
+        self._reader = reader
         if not self._poll_timer.isActive():
             self._poll_timer.start()
         self._send_command(Command.CONNECTION_STATE, allow_transient_failure=True)
@@ -862,12 +1096,16 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         if not self._open_retry_timer.isActive():
             self._open_retry_timer.start()
 
+    def _load_tray_icons(self):
+        icons = []
+        for name in TRAY_ICON_NAMES:
+            icon_path = self.icon_dir / f"{name}.png"
+            icons.append(QtGui.QIcon(str(icon_path)) if icon_path.is_file() else None)
+        return tuple(icons)
+
     def _init_tray(self):
-        self._tray_icons = {
-            name: QtGui.QIcon(str(self.icon_dir / f"{name}.png"))
-            for name in ("traydc", "tray0", "tray20", "tray40", "tray60", "tray80", "tray100")
-        }
-        icon = self._tray_icons.get("traydc", QtGui.QIcon(str(self.icon_dir / "traydc.png")))
+        self._tray_icons_by_bucket = self._load_tray_icons()
+        icon = self._tray_icons_by_bucket[0] or QtGui.QIcon()
         self._tray = QtWidgets.QSystemTrayIcon(icon, self)
         self._tray_menu = QtWidgets.QMenu()
         self._tray_toggle_action = self._tray_menu.addAction("Hide")
@@ -888,9 +1126,7 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             action = sleep_menu.addAction(label)
             action.setCheckable(True)
             action.triggered.connect(
-                lambda checked, selected_index=index: self._on_tray_sleep_selected(
-                    selected_index, checked
-                )
+                functools.partial(self._on_tray_sleep_selected, index)
             )
             self._tray_sleep_actions[index] = action
 
@@ -901,6 +1137,7 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._tray.setContextMenu(self._tray_menu)
         self._tray.activated.connect(self._on_tray_activated)
         self._tray.setToolTip("HyperX Alpha")
+        self._last_tray_state = None
         self._tray.show()
         self._set_tray_quick_controls_enabled(False)
         self._sync_tray_quick_controls_from_ui()
@@ -957,18 +1194,19 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             sleep_enabled=sleep_enabled,
         )
 
-    def _sync_tray_quick_controls_from_ui(self):
+    def _sync_tray_quick_controls_from_ui(self, only=None):
         if self._tray is None:
             return
         self._updating_tray_controls = True
         try:
-            if self._tray_voice_action is not None:
+            if only in (None, "voice") and self._tray_voice_action is not None:
                 self._tray_voice_action.setChecked(self.voice_switch.isChecked())
-            if self._tray_mic_action is not None:
+            if only in (None, "mic") and self._tray_mic_action is not None:
                 self._tray_mic_action.setChecked(self.mic_switch.isChecked())
-            sleep_index = self.sleep_combo.currentIndex()
-            for index, action in self._tray_sleep_actions.items():
-                action.setChecked(index == sleep_index)
+            if only in (None, "sleep"):
+                sleep_index = self.sleep_combo.currentIndex()
+                for index, action in self._tray_sleep_actions.items():
+                    action.setChecked(index == sleep_index)
         finally:
             self._updating_tray_controls = False
 
@@ -976,7 +1214,7 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         if self._updating_tray_controls:
             return
         if not self._can_use_realtime_controls():
-            self._sync_tray_quick_controls_from_ui()
+            self._sync_tray_quick_controls_from_ui("voice")
             return
         self._updating_controls = True
         self.voice_switch.setChecked(bool(active))
@@ -987,18 +1225,21 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         if self._updating_tray_controls:
             return
         if not self._can_use_realtime_controls():
-            self._sync_tray_quick_controls_from_ui()
+            self._sync_tray_quick_controls_from_ui("mic")
             return
         self._updating_controls = True
         self.mic_switch.setChecked(bool(active))
         self._updating_controls = False
         self._on_mic_toggle(bool(active))
 
-    def _on_tray_sleep_selected(self, index, checked):
+    def _on_tray_sleep_selected(self, index, checked=None):
+        if checked is None:
+            action = self._tray_sleep_actions.get(index)
+            checked = action is not None and action.isChecked()
         if self._updating_tray_controls or not checked:
             return
         if not self._can_use_sleep_controls():
-            self._sync_tray_quick_controls_from_ui()
+            self._sync_tray_quick_controls_from_ui("sleep")
             return
         if index not in (0, 1, 2):
             return
@@ -1036,13 +1277,18 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         event.accept()
 
     def _stop_reader(self):
-        if self._reader is None:
+        reader = self._reader
+        if reader is None:
             return
-        if self._reader.isRunning():
-            self._reader.stop()
-            if not self._reader.wait(1200):
-                self._log("Reader thread did not stop before shutdown timeout.")
         self._reader = None
+        if not isinstance(reader, DeviceReaderThread):
+            reader.stop()
+            reader.deleteLater()
+            return
+        if reader.isRunning():
+            reader.stop()
+            if not reader.wait(1200):
+                self._log("Reader thread did not stop before shutdown timeout.")
 
     def _stop_opener(self):
         self._open_generation += 1
@@ -1065,9 +1311,9 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         enabled = self.start_on_login_switch.isChecked()
         if enabled == previous:
             return
-        self.settings.start_on_login = enabled
-        if not self._settings_service.save(self.settings):
-            self.settings.start_on_login = previous
+        self.settings = dataclasses.replace(self.settings, start_on_login=enabled)
+        if not self._save_settings_now():
+            self.settings = dataclasses.replace(self.settings, start_on_login=previous)
             self._updating_settings = True
             self.start_on_login_switch.setChecked(previous)
             self._updating_settings = False
@@ -1080,8 +1326,8 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             self._updating_settings = True
             self.start_on_login_switch.setChecked(previous)
             self._updating_settings = False
-            self.settings.start_on_login = previous
-            if not self._settings_service.save(self.settings):
+            self.settings = dataclasses.replace(self.settings, start_on_login=previous)
+            if not self._save_settings_now():
                 self._log("Unable to roll back start-on-login setting after autostart error.")
             self._show_error("Autostart Error", "Unable to update autostart entry.")
 
@@ -1092,9 +1338,9 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         enabled = self.start_hidden_switch.isChecked()
         if enabled == previous:
             return
-        self.settings.start_hidden = enabled
-        if not self._settings_service.save(self.settings):
-            self.settings.start_hidden = previous
+        self.settings = dataclasses.replace(self.settings, start_hidden=enabled)
+        if not self._save_settings_now():
+            self.settings = dataclasses.replace(self.settings, start_hidden=previous)
             self._updating_settings = True
             self.start_hidden_switch.setChecked(previous)
             self._updating_settings = False
@@ -1109,8 +1355,8 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             self._updating_settings = True
             self.start_hidden_switch.setChecked(previous)
             self._updating_settings = False
-            self.settings.start_hidden = previous
-            if not self._settings_service.save(self.settings):
+            self.settings = dataclasses.replace(self.settings, start_hidden=previous)
+            if not self._save_settings_now():
                 self._log(
                     "Unable to roll back start-hidden setting after autostart update error."
                 )
@@ -1123,9 +1369,9 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         mode = self.theme_combo.currentData() or "system"
         if mode == previous_mode:
             return
-        self.settings.theme_mode = mode
-        if not self._settings_service.save(self.settings):
-            self.settings.theme_mode = previous_mode
+        self.settings = dataclasses.replace(self.settings, theme_mode=mode)
+        if not self._save_settings_now():
+            self.settings = dataclasses.replace(self.settings, theme_mode=previous_mode)
             previous_index = self.theme_combo.findData(previous_mode)
             if previous_index < 0:
                 previous_index = self.theme_combo.findData("system")
@@ -1144,21 +1390,31 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         enabled = self.notify_switch.isChecked()
         if enabled == previous:
             return
-        self.settings.tray_notifications = enabled
-        if not self._settings_service.save(self.settings):
-            self.settings.tray_notifications = previous
+        self.settings = dataclasses.replace(self.settings, tray_notifications=enabled)
+        if not self._save_settings_now():
+            self.settings = dataclasses.replace(
+                self.settings, tray_notifications=previous
+            )
             self._updating_settings = True
             self.notify_switch.setChecked(previous)
             self._updating_settings = False
             self._show_error("Settings Error", "Unable to save preferences.")
             return
+        self._tray_notifications_enabled = enabled
+        self._refresh_notifications_active()
         if not enabled:
             self._clear_pending_connection_notifications()
             self._clear_pending_battery_notifications()
             return
-        if enabled:
+        if self._notifications_active:
+            self._last_notified_battery = None
             self._maybe_notify_battery()
 
+    def _refresh_notifications_active(self):
+        self._notifications_active = (
+            self._tray is not None and self._tray_notifications_enabled
+        )
+
     def _on_sleep_changed(self, index):
         if self._updating_controls:
             return
@@ -1168,7 +1424,7 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             self._send_command(Command.SLEEP_TIMER_20)
         elif index == 2:
             self._send_command(Command.SLEEP_TIMER_30)
-        self._sync_tray_quick_controls_from_ui()
+        self._sync_tray_quick_controls_from_ui("sleep")
 
     def _on_voice_toggle(self, active):
         if self._updating_controls:
@@ -1177,21 +1433,20 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             self._send_command(Command.VOICE_PROMPTS)
         else:
             self._send_command(Command.VOICE_PROMPTS_OFF)
-        self._sync_tray_quick_controls_from_ui()
+        self._sync_tray_quick_controls_from_ui("voice")
 
     def _persist_mic_monitor_state(self, active):
         state = bool(active)
         if self.settings.mic_monitor_state == state:
             return
-        self.settings.mic_monitor_state = state
-        if not self._settings_service.save(self.settings):
-            self._log("Unable to persist mic monitor state.")
+        self.settings = dataclasses.replace(self.settings, mic_monitor_state=state)
+        self._mark_settings_dirty()
 
     def _set_mic_monitor_state(self, active, persist=True):
         self._updating_controls = True
         self.mic_switch.setChecked(bool(active))
         self._updating_controls = False
-        self._sync_tray_quick_controls_from_ui()
+        self._sync_tray_quick_controls_from_ui("mic")
         if persist:
             self._persist_mic_monitor_state(active)
 
@@ -1229,7 +1484,7 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         else:
             self._send_command(Command.MICROPHONE_MONITOR_OFF)
         self._persist_mic_monitor_state(active)
-        self._sync_tray_quick_controls_from_ui()
+        self._sync_tray_quick_controls_from_ui("mic")
 
     def _request_feature_states(self):
         if not self._device_ready:
@@ -1263,80 +1518,57 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._send_command(Command.PING, allow_transient_failure=True)
 
     def _maybe_notify_battery(self):
-        if not self.settings.tray_notifications:
+        if not self._tray_notifications_enabled:
             return
-        if self.battery is None:
+        if self.battery is None or self.battery == self._last_notified_battery:
             return
-        thresholds = (20, 10, 5)
-        for level in thresholds:
-            if self.battery > level:
-                self._battery_notified_levels.discard(level)
-        threshold = None
-        if self.battery <= 5:
-            threshold = 5
-        elif self.battery <= 10:
-            threshold = 10
-        elif self.battery <= 20:
-            threshold = 20
+        self._last_notified_battery = self.battery
+        _bucket, threshold, reached_mask = _BATTERY_LUT[self.battery]
+        self._battery_notified_mask &= reached_mask
         if threshold is None:
             return
 
-        if threshold in self._battery_notified_levels:
+        threshold_bit = 1 << _BATTERY_THRESHOLD_INDEX[threshold]
+        if self._battery_notified_mask & threshold_bit:
             return
-        for level in thresholds:
-            if level >= threshold:
-                self._battery_notified_levels.add(level)
+        self._battery_notified_mask |= reached_mask
         self._queue_battery_notification(threshold, self.battery)
 
     def _queue_battery_notification(self, threshold, battery_level):
         if self._tray is None:
             return
-        if not self.settings.tray_notifications:
+        if not self._tray_notifications_enabled:
             return
-        threshold = int(threshold)
-        battery_level = int(battery_level)
-        now = time.monotonic()
-        last_sent = self._battery_notification_last_sent.get(threshold)
-        if (
-            last_sent is not None
-            and now - last_sent < self._battery_notification_cooldown_seconds
-        ):
+        if time.monotonic() < self._battery_threshold_ready_at[
+            _BATTERY_THRESHOLD_INDEX[threshold]
+        ]:
             return
 
-        if self._pending_battery_notification is None:
-            self._pending_battery_notification = {
-                "threshold": threshold,
-                "battery": battery_level,
-                "count": 1,
-            }
-        else:
-            self._pending_battery_notification["threshold"] = min(
-                int(self._pending_battery_notification["threshold"]),
-                threshold,
-            )
-            self._pending_battery_notification["battery"] = min(
-                int(self._pending_battery_notification["battery"]),
-                battery_level,
-            )
-            self._pending_battery_notification["count"] = (
-                int(self._pending_battery_notification["count"]) + 1
+        pending = self._pending_battery_notification
+        if pending is None:
+            self._pending_battery_notification = PendingBatteryNotification(
+                threshold, battery_level
             )
-        self._battery_notify_timer.start()
+        else:
+            pending.threshold = min(pending.threshold, threshold)
+            pending.battery = min(pending.battery, battery_level)
+            pending.count += 1
+        self._queue_notification_flush(NOTIFY_FLUSH_BATTERY)
 
     def _flush_battery_notification(self):
         pending = self._pending_battery_notification
         self._pending_battery_notification = None
         if pending is None:
             return
-        if self._tray is None or not self.settings.tray_notifications:
+        if self._tray is None or not self._tray_notifications_enabled:
             return
 
-        battery_level = int(pending["battery"])
-        threshold = int(pending["threshold"])
-        grouped_count = int(pending["count"])
-        self._battery_notification_last_sent[threshold] = time.monotonic()
+        battery_level = pending.battery
+        self._battery_threshold_ready_at[_BATTERY_THRESHOLD_INDEX[pending.threshold]] = (
+            time.monotonic() + self._battery_notification_cooldown_seconds
+        )
         message = f"Battery at {battery_level}%"
-        if grouped_count > 1:
+        if pending.count > 1:
             message += " (grouped alerts)"
         self._tray.showMessage(
             "HyperX Alpha battery low",
@@ -1349,18 +1581,13 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
     def _send_connection_notification(self, connected):
         if self._tray is None:
             return
-        if not self.settings.tray_notifications:
+        if not self._tray_notifications_enabled:
             return
         self._pending_connection_notification = bool(connected)
-        now = time.monotonic()
-        self._connection_notification_events.append((now, bool(connected)))
-        cutoff = now - self._connection_event_window_seconds
-        while (
-            self._connection_notification_events
-            and self._connection_notification_events[0][0] < cutoff
-        ):
-            self._connection_notification_events.popleft()
-        self._connection_notify_timer.start()
+        index = self._connection_event_index
+        self._connection_event_times[index] = time.monotonic()
+        self._connection_event_index = (index + 1) % CONNECTION_EVENT_RING_SIZE
+        self._queue_notification_flush(NOTIFY_FLUSH_CONNECTION)
 
     def _flush_connection_notification(self):
         connected = self._pending_connection_notification
@@ -1369,17 +1596,10 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
             return
         if self._tray is None:
             return
-        if not self.settings.tray_notifications:
+        if not self._tray_notifications_enabled:
             return
-        now = time.monotonic()
-        cutoff = now - self._connection_event_window_seconds
-        while (
-            self._connection_notification_events
-            and self._connection_notification_events[0][0] < cutoff
-        ):
-            self._connection_notification_events.popleft()
-
-        changes = len(self._connection_notification_events)
+        cutoff = time.monotonic() - self._connection_event_window_seconds
+        changes = sum(1 for event_at in self._connection_event_times if event_at >= cutoff)
         if changes >= 3:
             title = "HyperX Alpha connection unstable"
             message = (
@@ -1412,47 +1632,63 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
 
     def _clear_pending_connection_notifications(self):
         self._pending_connection_notification = None
-        self._connection_notify_timer.stop()
-        self._connection_notification_events.clear()
+        self._cancel_notification_flush(NOTIFY_FLUSH_CONNECTION)
+        self._connection_event_times = [float("-inf")] * CONNECTION_EVENT_RING_SIZE
+        self._connection_event_index = 0
 
     def _clear_pending_battery_notifications(self):
         self._pending_battery_notification = None
-        self._battery_notify_timer.stop()
+        self._cancel_notification_flush(NOTIFY_FLUSH_BATTERY)
+
+    def _queue_notification_flush(self, flag):
+        self._pending_flush_flags |= flag
+        self._notify_timer.start()
+
+    def _cancel_notification_flush(self, flag):
+        self._pending_flush_flags &= ~flag
+        if not self._pending_flush_flags:
+            self._notify_timer.stop()
+
+    def _flush_notifications(self):
+        flags = self._pending_flush_flags
+        self._pending_flush_flags = 0
+        if flags & NOTIFY_FLUSH_CONNECTION:
+            self._flush_connection_notification()
+        if flags & NOTIFY_FLUSH_BATTERY:
+            self._flush_battery_notification()
 
     def _update_tray_icon(self):
+        if self._tray is None:
+            return
+        if not self._tray_refresh_timer.isActive():
+            self._tray_refresh_timer.start()
+
+    def _refresh_tray_icon(self):
         if self._tray is None:
             return
         if self.status != ConnectionStatus.CONNECTED or self.battery is None:
-            icon_name = "traydc"
-        elif self.battery <= 10:
-            icon_name = "tray0"
-        elif self.battery <= 30:
-            icon_name = "tray20"
-        elif self.battery <= 50:
-            icon_name = "tray40"
-        elif self.battery <= 70:
-            icon_name = "tray60"
-        elif self.battery <= 90:
-            icon_name = "tray80"
+            bucket = 0
         else:
-            icon_name = "tray100"
-        icon = self._tray_icons.get(icon_name)
-        if icon is None:
-            icon_path = self.icon_dir / f"{icon_name}.png"
-            icon = QtGui.QIcon(str(icon_path))
-            self._tray_icons[icon_name] = icon
-        self._tray.setIcon(icon)
-        self._tray.setToolTip(self._tray_tooltip())
+            bucket = _BATTERY_LUT[self.battery][0]
+        tooltip = self._tray_tooltip()
+        state = (bucket, tooltip)
+        if state == self._last_tray_state:
+            return
+        self._last_tray_state = state
+        icons = self._tray_icons_by_bucket
+        icon = icons[bucket] or icons[0]
+        if icon is not None:
+            self._tray.setIcon(icon)
+        self._tray.setToolTip(tooltip)
 
     def _tray_tooltip(self):
         if self._control_channel_busy and self._device_ready:
-            return "Headset detected (control channel busy)"
-        if self.status == ConnectionStatus.CONNECTED:
-            if self.battery is None:
-                return "Connected"
-            hours = self.battery * 3
-            return f"{hours} Hours Remaining ({self.battery}%)"
-        return "Power Off"
+            return TOOLTIP_BUSY
+        if self.status != ConnectionStatus.CONNECTED:
+            return TOOLTIP_DISCONNECTED
+        if self.battery is None:
+            return TOOLTIP_CONNECTED
+        return _BATTERY_TOOLTIPS[self.battery]
 
     def _apply_disconnected_state(
         self,
@@ -1470,11 +1706,12 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._update_tray_icon()
         if log_status_change and not was_disconnected:
             self._log("Status: DISCONNECTED")
-        if notify_status_change and not was_disconnected:
+        if notify_status_change and not was_disconnected and self._notifications_active:
             self._send_connection_notification(connected=False)
         self.battery = None
+        self._last_notified_battery = None
         if clear_battery_history:
-            self._battery_notified_levels.clear()
+            self._battery_notified_mask = 0
         self._clear_pending_battery_notifications()
         self._mic_state_reported = False
         self._mic_state_probe_timer.stop()
@@ -1493,7 +1730,8 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._update_tray_icon()
         if not was_connected:
             self._log("Status: CONNECTED")
-            self._send_connection_notification(connected=True)
+            if self._notifications_active:
+                self._send_connection_notification(connected=True)
             self._poll_timer.setInterval(POLL_INTERVAL_CONNECTED_MS)
             if not self._poll_timer.isActive():
                 self._poll_timer.start()
@@ -1514,9 +1752,8 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         elif value == 0x02:
             self._on_connect()
 
+    @_requires_connected
     def _handle_sleep_state_packet(self, value):
-        if self.status != ConnectionStatus.CONNECTED:
-            return
         self._updating_controls = True
         if value == 0x0A:
             self.sleep_combo.setCurrentIndex(0)
@@ -1525,42 +1762,51 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         elif value == 0x1E:
             self.sleep_combo.setCurrentIndex(2)
         self._updating_controls = False
-        self._sync_tray_quick_controls_from_ui()
+        self._sync_tray_quick_controls_from_ui("sleep")
 
+    @_requires_connected
     def _handle_voice_state_packet(self, value):
-        if self.status != ConnectionStatus.CONNECTED:
-            return
         self._updating_controls = True
         self.voice_switch.setChecked(value == 0x01)
         self._updating_controls = False
-        self._sync_tray_quick_controls_from_ui()
+        self._sync_tray_quick_controls_from_ui("voice")
 
+    @_requires_connected
     def _handle_mic_monitor_state_packet(self, value):
-        if self.status != ConnectionStatus.CONNECTED:
-            return
         if value in (0x00, 0x01):
             self._mic_state_reported = True
             self._mic_state_probe_timer.stop()
             self._handle_reported_mic_monitor_state(value == 0x01)
 
+    @_requires_connected
     def _handle_battery_state_packet(self, value):
-        if self.status != ConnectionStatus.CONNECTED:
-            return
         if not 0 <= value <= 100:
             self._log(f"Ignoring invalid battery value from headset: {value}")
             return
         self.battery = value
         self._set_status_text()
         self._update_tray_icon()
-        self._maybe_notify_battery()
+        if self._notifications_active:
+            self._maybe_notify_battery()
 
+    @_requires_connected
     def _handle_mic_monitor_feedback_packet(self, value):
-        if self.status != ConnectionStatus.CONNECTED:
-            return
         self._mic_state_reported = True
         self._mic_state_probe_timer.stop()
         self._handle_reported_mic_monitor_state(value > 0)
 
+    _PACKET_HANDLERS = {
+        0x03: _handle_connection_state_packet,
+        0x07: _handle_sleep_state_packet,
+        0x09: _handle_voice_state_packet,
+        0x0A: _handle_mic_monitor_state_packet,
+        0x0B: _handle_battery_state_packet,
+        0x12: _handle_sleep_state_packet,
+        0x13: _handle_voice_state_packet,
+        0x22: _handle_mic_monitor_feedback_packet,
+        0x24: _handle_connection_state_packet,
+    }
+
     def _handle_packet(self, data):
         if self._verbose_io_logs:
             HyperxWindow._emit_log(
@@ -1568,18 +1814,14 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
                 f"RX {self._format_packet(data)}",
                 level=LOG_LEVEL_DEBUG,
             )
-        if len(data) < 4:
-            return
-        if data[0] != 0x21 or data[1] != 0xBB:
+        if len(data) < 4 or not data.startswith(PACKET_HEADER):
             return
 
         self._transient_tx_failures = 0
         self._clear_tx_timeout_backoff()
-        code = data[2]
-        value = data[3]
-        handler = self._packet_handlers.get(code)
+        handler = self._PACKET_HANDLERS.get(data[2])
         if handler is not None:
-            handler(value)
+            handler(self, data[3])
 
     def quit(self):
         if self._shutting_down:
@@ -1588,11 +1830,21 @@ class HyperxWindow(HyperxViewMixin, QtWidgets.QWidget):
         self._invalidate_tx_session()
         self._poll_timer.stop()
         self._device_hotplug_timer.stop()
+        self._udev_settle_timer.stop()
+        self._udev_watcher.stop()
+        self._device_service.disable_device_cache()
         self._mic_state_probe_timer.stop()
         self._open_retry_timer.stop()
         self._log_flush_timer.stop()
+        self._tray_refresh_timer.stop()
+        if self._settings_pending is not None and not self._save_settings_now():
+            self._log("Unable to persist preferences on shutdown.")
+        settings_worker = self._settings_save_thread
+        if settings_worker is not None and settings_worker.is_alive():
+            settings_worker.join(1.0)
         self._clear_pending_connection_notifications()
         self._clear_pending_battery_notifications()
+        self._notify_timer.stop()
         self._stop_reader()
         self._stop_opener()
         self._stop_tx_worker()
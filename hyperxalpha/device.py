@@ -1,10 +1,11 @@
 import atexit
 import ctypes
+import os
+import struct
 import threading
-import time
 from dataclasses import dataclass
 
-from .constants import PRODUCT_ID, VENDOR_ID
+from .constants import PRODUCT_ID, VENDOR_ID, Command
 
 
 class HidUnavailable(RuntimeError):
@@ -53,6 +54,45 @@ class HidDeviceInfo:
     interface_number: int | None = None
 
 
+_HID_REQUIRED_PROTOTYPES = (
+    ("hid_init", (), ctypes.c_int),
+    ("hid_exit", (), ctypes.c_int),
+    ("hid_open", (ctypes.c_ushort, ctypes.c_ushort, ctypes.c_wchar_p), ctypes.c_void_p),
+    ("hid_close", (ctypes.c_void_p,), None),
+    (
+        "hid_write",
+        (ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_size_t),
+        ctypes.c_int,
+    ),
+    (
+        "hid_read_timeout",
+        (ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_size_t, ctypes.c_int),
+        ctypes.c_int,
+    ),
+)
+_HID_OPTIONAL_PROTOTYPES = (
+    ("hid_set_nonblocking", (ctypes.c_void_p, ctypes.c_int), ctypes.c_int),
+    ("hid_error", (ctypes.c_void_p,), ctypes.c_wchar_p),
+    ("hid_open_path", (ctypes.c_char_p,), ctypes.c_void_p),
+    ("hid_enumerate", (ctypes.c_ushort, ctypes.c_ushort), _HidDeviceInfoPtr),
+    ("hid_free_enumeration", (_HidDeviceInfoPtr,), None),
+)
+
+
+def _bind_prototypes(lib, prototypes, required):
+    bound = set()
+    for name, argtypes, restype in prototypes:
+        fn = getattr(lib, name, None)
+        if fn is None:
+            if required:
+                raise OSError(f"{name} is missing from libhidapi-hidraw")
+            continue
+        fn.argtypes = argtypes
+        fn.restype = restype
+        bound.add(name)
+    return bound
+
+
 class _HidrawBackend:
     _state_lock = threading.Lock()
     _shared_lib = None
@@ -74,8 +114,6 @@ class _HidrawBackend:
                 return
 
             lib = None
-            has_open_path = False
-            has_enumerate = False
             for name in ("libhidapi-hidraw.so.0", "libhidapi-hidraw.so"):
                 try:
                     lib = ctypes.CDLL(name)
@@ -85,48 +123,10 @@ class _HidrawBackend:
             if lib is None:
                 raise OSError("libhidapi-hidraw not found")
 
-            lib.hid_init.restype = ctypes.c_int
-            lib.hid_exit.restype = ctypes.c_int
-            lib.hid_open.argtypes = [
-                ctypes.c_ushort,
-                ctypes.c_ushort,
-                ctypes.c_wchar_p,
-            ]
-            lib.hid_open.restype = ctypes.c_void_p
-            lib.hid_close.argtypes = [ctypes.c_void_p]
-            lib.hid_write.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_ubyte),
-                ctypes.c_size_t,
-            ]
-            lib.hid_write.restype = ctypes.c_int
-            lib.hid_read_timeout.argtypes = [
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_ubyte),
-                ctypes.c_size_t,
-                ctypes.c_int,
-            ]
-            lib.hid_read_timeout.restype = ctypes.c_int
-            try:
-                lib.hid_set_nonblocking.argtypes = [ctypes.c_void_p, ctypes.c_int]
-                lib.hid_set_nonblocking.restype = ctypes.c_int
-            except AttributeError:
-                pass
-            try:
-                lib.hid_error.argtypes = [ctypes.c_void_p]
-                lib.hid_error.restype = ctypes.c_wchar_p
-            except AttributeError:
-                pass
-            if hasattr(lib, "hid_open_path"):
-                lib.hid_open_path.argtypes = [ctypes.c_char_p]
-                lib.hid_open_path.restype = ctypes.c_void_p
-                has_open_path = True
-            if hasattr(lib, "hid_enumerate") and hasattr(lib, "hid_free_enumeration"):
-                lib.hid_enumerate.argtypes = [ctypes.c_ushort, ctypes.c_ushort]
-                lib.hid_enumerate.restype = _HidDeviceInfoPtr
-                lib.hid_free_enumeration.argtypes = [_HidDeviceInfoPtr]
-                lib.hid_free_enumeration.restype = None
-                has_enumerate = True
+            _bind_prototypes(lib, _HID_REQUIRED_PROTOTYPES, required=True)
+            optional = _bind_prototypes(lib, _HID_OPTIONAL_PROTOTYPES, required=False)
+            has_open_path = "hid_open_path" in optional
+            has_enumerate = {"hid_enumerate", "hid_free_enumeration"} <= optional
 
             if lib.hid_init() < 0:
                 raise OSError("hidapi init failed")
@@ -142,6 +142,7 @@ class _HidrawBackend:
 
     @classmethod
     def _shutdown_shared_backend(cls):
+        global _shared_backend
         with cls._state_lock:
             lib = cls._shared_lib
             if lib is None:
@@ -151,11 +152,12 @@ class _HidrawBackend:
             except (AttributeError, OSError, TypeError, ValueError):
                 pass
             cls._shared_lib = None
+            _shared_backend = None
             cls._shared_has_open_path = False
             cls._shared_has_enumerate = False
             cls._shared_initialized = False
 
-    def enumerate(self, vendor_id=0, product_id=0):
+    def enumerate(self, vendor_id=0, product_id=0, id_filter=None):
         if not self._has_enumerate:
             return []
         head = self._lib.hid_enumerate(int(vendor_id), int(product_id))
@@ -164,6 +166,12 @@ class _HidrawBackend:
         try:
             while current:
                 entry = current.contents
+                if (
+                    id_filter is not None
+                    and (entry.vendor_id, entry.product_id) not in id_filter
+                ):
+                    current = entry.next
+                    continue
                 path = (
                     entry.path.decode("utf-8", errors="ignore")
                     if entry.path
@@ -209,10 +217,23 @@ class _HidrawBackend:
         return _HidrawHandle(self._lib, handle)
 
 
+_shared_backend = None
+
+
+def _get_backend():
+    global _shared_backend
+    backend = _shared_backend
+    if backend is None:
+        backend = _shared_backend = _HidrawBackend()
+    return backend
+
+
 class _HidrawHandle:
     def __init__(self, lib, handle):
         self._lib = lib
         self._handle = handle
+        self._read_buf = (ctypes.c_ubyte * 64)()
+        self._write_buf = (ctypes.c_ubyte * 8)()
 
     def close(self):
         if self._handle:
@@ -220,24 +241,38 @@ class _HidrawHandle:
             self._handle = None
 
     def write(self, payload):
-        data = (ctypes.c_ubyte * len(payload))(*payload)
-        result = self._lib.hid_write(self._handle, data, len(payload))
+        size = len(payload)
+        if isinstance(payload, bytes) and size <= len(self._write_buf):
+            ctypes.memmove(self._write_buf, payload, size)
+            data = self._write_buf
+        else:
+            data = (ctypes.c_ubyte * size)(*payload)
+        return self._write_buffer(data, size)
+
+    def write_int_be(self, value):
+        struct.pack_into(">I", self._write_buf, 0, value)
+        return self._write_buffer(self._write_buf, 4)
+
+    def _write_buffer(self, data, size):
+        result = self._lib.hid_write(self._handle, data, size)
         if result < 0:
             raise HidIoError(f"hid_write failed: {self._last_error()}")
-        if result != len(payload):
+        if result != size:
             raise HidIoError(
-                f"hid_write incomplete: wrote {result} of {len(payload)} bytes"
+                f"hid_write incomplete: wrote {result} of {size} bytes"
             )
         return result
 
     def read(self, size, timeout_ms):
-        buffer = (ctypes.c_ubyte * size)()
+        buffer = self._read_buf
+        if size > len(buffer):
+            buffer = self._read_buf = (ctypes.c_ubyte * size)()
         res = self._lib.hid_read_timeout(self._handle, buffer, size, timeout_ms)
         if res < 0:
             raise HidIoError(f"hid_read_timeout failed: {self._last_error()}")
         if res == 0:
-            return []
-        return list(buffer[:res])
+            return b""
+        return bytes(memoryview(buffer)[:res])
 
     def _last_error(self):
         try:
@@ -256,13 +291,17 @@ class HyperxDevice:
         self.device_path = None
         self._dev = None
         self._backend = None
+        self._read_fd = None
+        self._opened_event = threading.Event()
         self._io_lock = threading.Lock()
 
     @staticmethod
-    def list_devices(vendor_id=VENDOR_ID, product_id=0):
+    def list_devices(vendor_id=VENDOR_ID, product_id=0, id_filter=None):
         try:
-            hidraw = _HidrawBackend()
-            return hidraw.enumerate(vendor_id=vendor_id, product_id=product_id)
+            hidraw = _get_backend()
+            return hidraw.enumerate(
+                vendor_id=vendor_id, product_id=product_id, id_filter=id_filter
+            )
         except Exception as exc:
             detail = _exception_detail(exc)
             raise HidUnavailable(
@@ -281,15 +320,18 @@ class HyperxDevice:
 
     def open(self):
         try:
-            hidraw = _HidrawBackend()
+            hidraw = _get_backend()
             dev = hidraw.open(
                 self.vendor_id,
                 self.product_id,
                 device_path=self.device_path,
             )
+            read_fd = self._open_read_fd()
             with self._io_lock:
                 self._dev = dev
                 self._backend = "hidraw"
+                self._read_fd = read_fd
+            self._opened_event.set()
         except Exception as exc:
             with self._io_lock:
                 self._dev = None
@@ -307,10 +349,30 @@ class HyperxDevice:
             ) from exc
         return True
 
+    def _open_read_fd(self):
+        path = self.device_path
+        if not path or not path.startswith("/dev/hidraw"):
+            return None
+        try:
+            return os.open(path, os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+        except OSError:
+            return None
+
+    def fileno(self):
+        return self._read_fd
+
     def close(self):
         with self._io_lock:
             dev = self._dev
+            read_fd = self._read_fd
             self._dev = None
+            self._read_fd = None
+            self._opened_event.clear()
+        if read_fd is not None:
+            try:
+                os.close(read_fd)
+            except OSError:
+                pass
         if dev is None:
             return
         try:
@@ -319,27 +381,44 @@ class HyperxDevice:
             pass
 
     def send_command(self, cmd):
-        payload = int(cmd).to_bytes(4, "big")
         with self._io_lock:
             dev = self._dev
             if dev is None:
                 return False
-            try:
-                dev.write(payload)
-            except TypeError:
-                dev.write(list(payload))
+            if type(cmd) is not Command:
+                dev.write_int_be(int(cmd))
+                return True
+            dev.write(cmd.payload)
         return True
 
     def read(self, timeout_ms=100):
         timeout_ms = max(20, int(timeout_ms))
+        with self._io_lock:
+            dev = self._dev
+        if dev is None:
+            self._opened_event.wait(timeout_ms / 1000.0)
+            return None
         with self._io_lock:
             dev = self._dev
             if dev is None:
-                time.sleep(min(timeout_ms, 50) / 1000.0)
                 return None
             data = dev.read(32, timeout_ms)
-        if not data:
-            return None
-        if isinstance(data, bytes):
-            return list(data)
-        return data
+        return data or None
+
+    def read_nonblocking(self, size=32):
+        with self._io_lock:
+            read_fd = self._read_fd
+            if read_fd is None:
+                dev = self._dev
+                if dev is None:
+                    return None
+                return dev.read(size, 0) or None
+            try:
+                data = os.read(read_fd, size)
+            except BlockingIOError:
+                return None
+            except OSError as exc:
+                raise HidIoError(
+                    f"hidraw read failed: {_exception_detail(exc)}"
+                ) from exc
+        return data or None
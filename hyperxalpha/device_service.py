@@ -1,8 +1,12 @@
-from dataclasses import dataclass
+import errno
+import socket
+import sys
+from dataclasses import dataclass, field
+from operator import attrgetter
 
 from PySide6 import QtCore
 
-from .constants import COMPATIBLE_MODELS, PRODUCT_ID, VENDOR_ID
+from .constants import COMPATIBLE_IDS, COMPATIBLE_MODELS, PRODUCT_ID, VENDOR_ID
 from .device import HidIoError, HyperxDevice
 
 
@@ -16,16 +20,66 @@ class DeviceDescriptor:
     serial_number: str | None
     manufacturer_string: str | None
     product_string: str | None
+    _display_name: str = field(init=False, repr=False, compare=False)
+    sort_key: str = field(init=False, repr=False, compare=False)
 
-    def display_name(self):
+    def __post_init__(self):
         details = [self.model_name, f"[{self.vendor_id:04X}:{self.product_id:04X}]"]
         if self.serial_number:
             details.append(f"SN:{self.serial_number}")
-        return " ".join(details)
+        display_name = " ".join(details)
+        object.__setattr__(self, "_display_name", display_name)
+        object.__setattr__(self, "sort_key", display_name.lower())
+
+    def display_name(self):
+        return self._display_name
+
+
+class DeviceReader(QtCore.QObject):
+    packet_received = QtCore.Signal(bytes)
+    io_failed = QtCore.Signal(str)
+
+    def __init__(self, device_service, parent=None):
+        super().__init__(parent)
+        self._device_service = device_service
+        self._notifier = None
+
+    def start(self):
+        if not sys.platform.startswith("linux") or self._notifier is not None:
+            return self._notifier is not None
+        fd = self._device_service.fileno()
+        if fd is None:
+            return False
+        self._notifier = QtCore.QSocketNotifier(fd, QtCore.QSocketNotifier.Read, self)
+        self._notifier.activated.connect(self._drain)
+        return True
+
+    def stop(self):
+        notifier = self._notifier
+        if notifier is None:
+            return
+        self._notifier = None
+        notifier.setEnabled(False)
+        notifier.deleteLater()
+
+    def _drain(self, *_args):
+        service = self._device_service
+        while self._notifier is not None:
+            try:
+                data = service.read_nonblocking()
+            except HidIoError as exc:
+                self.io_failed.emit(str(exc))
+                return
+            except Exception as exc:
+                self.io_failed.emit(f"Unexpected device read error: {exc}")
+                return
+            if data is None:
+                return
+            self.packet_received.emit(data)
 
 
-class DeviceReader(QtCore.QThread):
-    packet_received = QtCore.Signal(list)
+class DeviceReaderThread(QtCore.QThread):
+    packet_received = QtCore.Signal(bytes)
     io_failed = QtCore.Signal(str)
 
     def __init__(self, device_service, read_timeout_ms=100, parent=None):
@@ -35,24 +89,128 @@ class DeviceReader(QtCore.QThread):
         self._running = True
 
     def run(self):
+        service = self._device_service
         while self._running and not self.isInterruptionRequested():
             try:
-                data = self._device_service.read(timeout_ms=self._read_timeout_ms)
+                data = service.read(timeout_ms=self._read_timeout_ms)
+                while data is not None:
+                    self.packet_received.emit(data)
+                    if not self._running:
+                        return
+                    data = service.read_nonblocking()
             except HidIoError as exc:
                 self.io_failed.emit(str(exc))
                 return
             except Exception as exc:
                 self.io_failed.emit(f"Unexpected device read error: {exc}")
                 return
-            if data is None:
-                continue
-            self.packet_received.emit(data)
 
     def stop(self):
         self._running = False
         self.requestInterruption()
 
 
+NETLINK_KOBJECT_UEVENT = 15
+UEVENT_KERNEL_GROUP = 1
+
+
+def _parse_uevent(message):
+    fields = {}
+    for item in message.split(b"\0")[1:]:
+        key, sep, value = item.partition(b"=")
+        if sep:
+            fields[key.decode("ascii", "ignore")] = value.decode("utf-8", "ignore")
+    return fields
+
+
+def _hidraw_ids_from_sysfs(devpath):
+    try:
+        with open(f"/sys{devpath}/device/uevent", "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("HID_ID="):
+                    _bus, vendor, product = line.strip()[7:].split(":")
+                    return int(vendor, 16), int(product, 16)
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+class UdevWatcher(QtCore.QObject):
+    device_added = QtCore.Signal(str)
+    device_removed = QtCore.Signal(str)
+    events_lost = QtCore.Signal()
+    failed = QtCore.Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._socket = None
+        self._notifier = None
+
+    def start(self):
+        if not sys.platform.startswith("linux") or self._socket is not None:
+            return self._socket is not None
+        try:
+            sock = socket.socket(
+                socket.AF_NETLINK,
+                socket.SOCK_DGRAM | socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC,
+                NETLINK_KOBJECT_UEVENT,
+            )
+        except (AttributeError, OSError):
+            return False
+        try:
+            sock.bind((0, UEVENT_KERNEL_GROUP))
+        except OSError:
+            sock.close()
+            return False
+        self._socket = sock
+        self._notifier = QtCore.QSocketNotifier(
+            sock.fileno(), QtCore.QSocketNotifier.Read, self
+        )
+        self._notifier.activated.connect(self._drain)
+        return True
+
+    def stop(self):
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _drain(self, *_args):
+        while self._socket is not None:
+            try:
+                message = self._socket.recv(8192)
+            except BlockingIOError:
+                return
+            except OSError as exc:
+                # The receive buffer overflowed; the socket itself is still usable.
+                if exc.errno == errno.ENOBUFS:
+                    self.events_lost.emit()
+                    continue
+                self.stop()
+                self.failed.emit(str(exc))
+                return
+            self._dispatch(message)
+
+    def _dispatch(self, message):
+        action, _sep, _devpath = message.partition(b"\0")[0].partition(b"@")
+        if action not in (b"add", b"remove"):
+            return
+        fields = _parse_uevent(message)
+        if fields.get("SUBSYSTEM") != "hidraw":
+            return
+        device_path = f"/dev/{fields.get('DEVNAME', '')}"
+        if action == b"remove":
+            self.device_removed.emit(device_path)
+            return
+        ids = _hidraw_ids_from_sysfs(fields.get("DEVPATH", ""))
+        if ids is not None and ids not in COMPATIBLE_IDS:
+            return
+        self.device_added.emit(device_path)
+
+
 class DeviceOpenSignals(QtCore.QObject):
     opened = QtCore.Signal(int)
     failed = QtCore.Signal(int, str)
@@ -62,9 +220,25 @@ class DeviceService:
     def __init__(self, vendor_id=VENDOR_ID, product_id=PRODUCT_ID):
         self._device = HyperxDevice(vendor_id=vendor_id, product_id=product_id)
         self._descriptors_by_key = {}
+        self._cached_descriptors = None
+        self._device_cache_enabled = False
+
+    def enable_device_cache(self):
+        self._device_cache_enabled = True
+
+    def disable_device_cache(self):
+        self._device_cache_enabled = False
+        self._cached_descriptors = None
+
+    def invalidate_device_cache(self):
+        self._cached_descriptors = None
 
     def list_compatible_devices(self):
-        devices = HyperxDevice.list_devices(vendor_id=VENDOR_ID, product_id=0)
+        if self._device_cache_enabled and self._cached_descriptors is not None:
+            return list(self._cached_descriptors)
+        devices = HyperxDevice.list_devices(
+            vendor_id=VENDOR_ID, product_id=0, id_filter=COMPATIBLE_IDS
+        )
         descriptors = []
         dedupe_keys = set()
         for info in devices:
@@ -75,8 +249,9 @@ class DeviceService:
                 continue
             dedupe_keys.add(descriptor.key)
             descriptors.append(descriptor)
-        descriptors.sort(key=lambda item: item.display_name().lower())
+        descriptors.sort(key=attrgetter("sort_key"))
         self._descriptors_by_key = {item.key: item for item in descriptors}
+        self._cached_descriptors = tuple(descriptors)
         return descriptors
 
     def select_device(self, key):
@@ -109,6 +284,12 @@ class DeviceService:
     def read(self, timeout_ms=100):
         return self._device.read(timeout_ms=timeout_ms)
 
+    def fileno(self):
+        return self._device.fileno()
+
+    def read_nonblocking(self):
+        return self._device.read_nonblocking()
+
     def _to_descriptor(self, info):
         if not self._is_compatible(info):
             return None
@@ -131,12 +312,12 @@ class DeviceService:
         )
 
     def _is_compatible(self, info):
-        return (info.vendor_id, info.product_id) in COMPATIBLE_MODELS
+        return (info.vendor_id, info.product_id) in COMPATIBLE_IDS
 
     def _model_name(self, info):
-        model_key = (info.vendor_id, info.product_id)
-        if model_key in COMPATIBLE_MODELS:
-            return COMPATIBLE_MODELS[model_key]
+        model_name = COMPATIBLE_MODELS.get((info.vendor_id, info.product_id))
+        if model_name is not None:
+            return model_name
         if info.product_string:
-            return info.product_string
+            return sys.intern(info.product_string)
         return f"HyperX compatible model 0x{info.product_id:04X}"
@@ -1,11 +1,18 @@
 import json
 import os
 import shutil
-import tempfile
+import threading
 from dataclasses import dataclass
+from stat import S_ISREG
+from types import MappingProxyType
 from typing import Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / (
     "hyperxalpha"
 )
@@ -19,10 +26,26 @@ USER_LAUNCHER_PATH = Path.home() / ".local" / "bin" / "hyperxalpha"
 SYSTEM_ICON_PATH = Path("/opt/hyperxalpha/hyperxalpha/assets/img/hyperx.png")
 LOCAL_ICON_PATH = Path(__file__).resolve().parent / "assets" / "img" / "hyperx.png"
 SOURCE_ROOT = Path(__file__).resolve().parent.parent
-VALID_THEME_MODES = {"system", "light", "dark"}
+VALID_THEME_MODES = frozenset({"system", "light", "dark"})
+_BOOL_STRINGS = MappingProxyType(
+    {
+        "1": True,
+        "true": True,
+        "yes": True,
+        "on": True,
+        "0": False,
+        "false": False,
+        "no": False,
+        "off": False,
+    }
+)
+_DESKTOP_ESCAPE = str.maketrans({"\\": "\\\\", " ": "\\ "})
+_cached_signature = None
+_cached_settings = None
+_cached_launcher = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppSettings:
     start_on_login: bool = False
     start_hidden: bool = False
@@ -33,16 +56,12 @@ class AppSettings:
 
 
 def _parse_bool(value):
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
-    if isinstance(value, int) and value in (0, 1):
-        return bool(value)
+    if isinstance(value, int):
+        return bool(value) if value in (0, 1) else None
     if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"1", "true", "yes", "on"}:
-            return True
-        if normalized in {"0", "false", "no", "off"}:
-            return False
+        return _BOOL_STRINGS.get(value.strip().lower())
     return None
 
 
@@ -57,21 +76,57 @@ def _normalize_device_key(value):
 
 def _normalize_theme_mode(value):
     if isinstance(value, str):
+        if value in VALID_THEME_MODES:
+            return value
         normalized = value.strip().lower()
         if normalized in VALID_THEME_MODES:
             return normalized
     return "system"
 
 
+def _decode_settings(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_settings_file():
+    fd = os.open(CONFIG_PATH, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        stat = os.fstat(fd)
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(stat.st_size + 1, 4096))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return (stat.st_mtime_ns, stat.st_size), b"".join(chunks)
+
+
 def load_settings():
+    global _cached_signature, _cached_settings
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        stat = os.stat(CONFIG_PATH)
+    except OSError:
+        return AppSettings()
+    if (stat.st_mtime_ns, stat.st_size) == _cached_signature:
+        return _cached_settings
+    try:
+        signature, raw = _read_settings_file()
+        data = _decode_settings(raw)
     except FileNotFoundError:
         return AppSettings()
     except (OSError, json.JSONDecodeError):
         return AppSettings()
+    settings = _parse_settings(data)
+    _cached_signature = signature
+    _cached_settings = settings
+    return settings
+
 
+def _parse_settings(data):
     start_on_login = _parse_bool(data.get("start_on_login"))
     start_hidden = _parse_bool(data.get("start_hidden"))
     mic_monitor_state = _parse_bool(data.get("mic_monitor_state"))
@@ -92,7 +147,37 @@ def load_settings():
     )
 
 
+def _encode_settings(payload):
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _fsync_dir(path):
+    flags = getattr(os, "O_DIRECTORY", None)
+    if flags is None:
+        return
+    try:
+        dir_fd = os.open(path, os.O_RDONLY | flags | os.O_CLOEXEC)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 def save_settings(settings: AppSettings):
+    global _cached_signature, _cached_settings
     temp_path = None
     try:
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -108,19 +193,24 @@ def save_settings(settings: AppSettings):
             payload["selected_device_key"] = selected_device_key
         payload["tray_notifications"] = bool(settings.tray_notifications)
         payload["theme_mode"] = _normalize_theme_mode(settings.theme_mode)
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=CONFIG_DIR,
-            prefix="settings-",
-            suffix=".json",
-            delete=False,
-        ) as handle:
-            json.dump(payload, handle, indent=2)
-            handle.flush()
-            os.fsync(handle.fileno())
-            temp_path = Path(handle.name)
+        data = _encode_settings(payload)
+        temp_path = CONFIG_DIR / (
+            f"{CONFIG_PATH.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        fd = os.open(
+            temp_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC | os.O_NOFOLLOW,
+            0o600,
+        )
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(temp_path, CONFIG_PATH)
+        _fsync_dir(CONFIG_DIR)
+        _cached_signature = None
+        _cached_settings = None
         return True
     except OSError:
         return False
@@ -137,7 +227,7 @@ def autostart_enabled():
 
 
 def _escape_desktop_value(value):
-    return value.replace("\\", "\\\\").replace(" ", "\\ ")
+    return value.translate(_DESKTOP_ESCAPE)
 
 
 def _user_launcher_script_content():
@@ -155,7 +245,15 @@ def _ensure_user_launcher():
         USER_LAUNCHER_PATH.parent.mkdir(parents=True, exist_ok=True)
         expected = _user_launcher_script_content()
         needs_write = True
-        if USER_LAUNCHER_PATH.is_file():
+        try:
+            current_stat = os.stat(USER_LAUNCHER_PATH)
+        except FileNotFoundError:
+            current_stat = None
+        if (
+            current_stat is not None
+            and S_ISREG(current_stat.st_mode)
+            and current_stat.st_size == len(expected.encode("utf-8"))
+        ):
             current = USER_LAUNCHER_PATH.read_text(encoding="utf-8")
             needs_write = current != expected
         if needs_write:
@@ -166,19 +264,48 @@ def _ensure_user_launcher():
         return None
 
 
-def _resolve_exec_command(start_hidden=False):
-    launcher = None
+def _launcher_signature():
+    signature = []
     for candidate in (SYSTEM_LAUNCHER_PATH, USER_LAUNCHER_PATH):
-        if candidate.is_file():
+        try:
+            candidate_stat = os.stat(candidate)
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append(
+            candidate_stat.st_mtime_ns if S_ISREG(candidate_stat.st_mode) else None
+        )
+    return tuple(signature)
+
+
+def _resolve_launcher():
+    global _cached_launcher
+    signature = _launcher_signature()
+    if _cached_launcher is not None and _cached_launcher[0] == signature:
+        return _cached_launcher[1]
+    launcher = None
+    for candidate, mtime_ns in zip(
+        (SYSTEM_LAUNCHER_PATH, USER_LAUNCHER_PATH), signature
+    ):
+        if mtime_ns is not None:
             launcher = candidate
             break
     if launcher is None:
         found = shutil.which("hyperxalpha")
         if found:
-            launcher = Path(found)
+            # The signature does not cover PATH-resolved files, so never cache them.
+            return Path(found)
     if launcher is None:
         launcher = _ensure_user_launcher()
+        if launcher is not None:
+            signature = _launcher_signature()
+    if launcher is not None:
+        _cached_launcher = (signature, launcher)
+    return launcher
 
+
+def _resolve_exec_command(start_hidden=False):
+    launcher = _resolve_launcher()
     if launcher is not None:
         command = _escape_desktop_value(str(launcher))
     else:
@@ -219,12 +346,14 @@ def set_autostart(enabled: bool, start_hidden=False):
                 _autostart_desktop_entry(start_hidden=start_hidden),
                 encoding="utf-8",
             )
+            _fsync_dir(AUTOSTART_DIR)
             return True
         except OSError:
             return False
 
     try:
         AUTOSTART_PATH.unlink()
+        _fsync_dir(AUTOSTART_DIR)
         return True
     except FileNotFoundError:
         return True
@@ -1,8 +1,283 @@
+import functools
+from string import Template
+
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from . import APP_NAME
 from .constants import ConnectionStatus
 
+LOG_VIEW_MAX_BLOCKS = 5000
+LOG_VIEW_FLUSH_DELAY_MS = 16
+TOGGLE_SWITCH_SIZE = QtCore.QSize(46, 24)
+_ALIGN_LEFT_VCENTER = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+_ROLE_WINDOW = QtGui.QPalette.Window
+_TEXT_END = QtGui.QTextCursor.End
+try:
+    _SCHEME_DARK = QtCore.Qt.ColorScheme.Dark
+    _SCHEME_LIGHT = QtCore.Qt.ColorScheme.Light
+except AttributeError:
+    _SCHEME_DARK = _SCHEME_LIGHT = None
+
+_QSS_TEMPLATE = Template(
+    """
+            QWidget {
+                font-family: 'IBM Plex Sans', 'Source Sans 3', 'Noto Sans', sans-serif;
+                font-size: 13px;
+            }
+            QWidget#rootWindow { background-color: $root_window_bg; }
+            QFrame#heroCard {
+                background-color: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 $hero_card_gradient_start, stop:1 $hero_card_gradient_end
+                );
+                border: 1px solid $hero_card_border;
+                border-radius: 16px;
+            }
+            #titleLabel { font-size: 23px; font-weight: 700; color: $title_label_fg; letter-spacing: 0.2px; }
+            #subtitleLabel { color: $subtitle_label_fg; font-size: 13px; }
+            #statusLabel { color: $status_label_fg; font-size: 15px; font-weight: 600; }
+            #subtleLabel { color: $subtle_label_fg; font-size: 12px; }
+            #batterySummary { color: $battery_summary_fg; font-weight: 600; }
+            #sectionHint { color: $section_hint_fg; font-size: 12px; line-height: 1.35; }
+            QLabel#statusPill {
+                border-radius: 999px;
+                padding: 6px 12px;
+                border: 1px solid $status_pill_border;
+                font-weight: 700;
+                background-color: $status_pill_bg;
+                color: $status_pill_fg;
+            }
+            QLabel#statusPill[state="connected"] {
+                background-color: $status_pill_connected_bg;
+                border-color: $status_pill_connected_border;
+                color: $status_pill_connected_fg;
+            }
+            QLabel#statusPill[state="disconnected"] {
+                background-color: $status_pill_disconnected_bg;
+                border-color: $status_pill_disconnected_border;
+                color: $status_pill_disconnected_fg;
+            }
+            QLabel#statusPill[state="busy"] {
+                background-color: $status_pill_busy_bg;
+                border-color: $status_pill_busy_border;
+                color: $status_pill_busy_fg;
+            }
+            QLabel { color: $label_fg; }
+            QGroupBox#card {
+                background-color: $card_bg;
+                border: 1px solid $card_border;
+                border-radius: 14px;
+                margin-top: 13px;
+                padding-top: 8px;
+            }
+            QGroupBox#card::title {
+                subcontrol-origin: margin;
+                subcontrol-position: top left;
+                left: 12px;
+                padding: 0 8px;
+                color: $card_title_fg;
+                font-weight: 700;
+            }
+            QComboBox {
+                background-color: $combo_bg;
+                color: $combo_fg;
+                border: 1px solid $combo_border;
+                border-radius: 8px;
+                padding: 5px 26px 5px 10px;
+                min-height: 30px;
+            }
+            QComboBox:hover { border-color: $combo_hover_border; }
+            QComboBox::drop-down { border: none; width: 24px; }
+            QComboBox QAbstractItemView {
+                background-color: $combo_popup_bg;
+                color: $combo_popup_fg;
+                border: 1px solid $combo_popup_border;
+                selection-background-color: $combo_popup_selection_bg;
+            }
+            QProgressBar#batteryBar {
+                background-color: $battery_bar_bg;
+                border: 1px solid $battery_bar_border;
+                border-radius: 5px;
+            }
+            QProgressBar#batteryBar::chunk {
+                border-radius: 5px;
+                background-color: $battery_bar_chunk_bg;
+            }
+            QProgressBar#batteryBar[state="disconnected"]::chunk { background-color: $battery_bar_disconnected_chunk_bg; }
+            QProgressBar#batteryBar[state="busy"]::chunk { background-color: $battery_bar_busy_chunk_bg; }
+            QPushButton {
+                min-height: 34px;
+                border-radius: 9px;
+                padding: 6px 10px;
+                font-weight: 600;
+            }
+            QPushButton#softButton {
+                background-color: $soft_button_bg;
+                color: $soft_button_fg;
+                border: 1px solid $soft_button_border;
+            }
+            QPushButton#softButton:hover { background-color: $soft_button_hover_bg; }
+            QPushButton#destructiveButton {
+                background-color: $destructive_button_bg;
+                color: white;
+                border: 1px solid $destructive_button_border;
+            }
+            QPushButton#destructiveButton:hover { background-color: $destructive_button_hover_bg; }
+"""
+)
+
+_DARK_TOKENS = {
+    "root_window_bg": "#0a1321",
+    "hero_card_gradient_start": "#101f33",
+    "hero_card_gradient_end": "#17283f",
+    "hero_card_border": "rgba(165, 200, 232, 0.20)",
+    "title_label_fg": "#f8fbff",
+    "subtitle_label_fg": "#a6bdd6",
+    "status_label_fg": "#d9e8f7",
+    "subtle_label_fg": "#9ab4ce",
+    "battery_summary_fg": "#e5eef8",
+    "section_hint_fg": "#9fb0c2",
+    "status_pill_border": "rgba(179, 214, 255, 0.38)",
+    "status_pill_bg": "rgba(40, 70, 100, 0.35)",
+    "status_pill_fg": "#dceaf9",
+    "status_pill_connected_bg": "rgba(37, 148, 120, 0.22)",
+    "status_pill_connected_border": "rgba(130, 247, 206, 0.60)",
+    "status_pill_connected_fg": "#9ff8d8",
+    "status_pill_disconnected_bg": "rgba(128, 80, 80, 0.22)",
+    "status_pill_disconnected_border": "rgba(255, 178, 178, 0.45)",
+    "status_pill_disconnected_fg": "#ffd2d2",
+    "status_pill_busy_bg": "rgba(196, 140, 53, 0.22)",
+    "status_pill_busy_border": "rgba(255, 213, 137, 0.50)",
+    "status_pill_busy_fg": "#ffe3a8",
+    "label_fg": "#e7f0fb",
+    "card_bg": "#101b2d",
+    "card_border": "rgba(165, 195, 225, 0.22)",
+    "card_title_fg": "#d0e2f6",
+    "combo_bg": "#0d1727",
+    "combo_fg": "#e6f0fb",
+    "combo_border": "rgba(150, 182, 214, 0.45)",
+    "combo_hover_border": "#77a8d9",
+    "combo_popup_bg": "#0f1c30",
+    "combo_popup_fg": "#e8f1fb",
+    "combo_popup_border": "#2e4664",
+    "combo_popup_selection_bg": "#2e5d8c",
+    "battery_bar_bg": "#2a3a4d",
+    "battery_bar_border": "rgba(168, 196, 224, 0.30)",
+    "battery_bar_chunk_bg": "#58c7a2",
+    "battery_bar_disconnected_chunk_bg": "#64748b",
+    "battery_bar_busy_chunk_bg": "#d4a44f",
+    "soft_button_bg": "rgba(112, 192, 255, 0.16)",
+    "soft_button_fg": "#cbe6ff",
+    "soft_button_border": "rgba(112, 192, 255, 0.32)",
+    "soft_button_hover_bg": "rgba(112, 192, 255, 0.25)",
+    "destructive_button_bg": "#d95858",
+    "destructive_button_border": "#c74444",
+    "destructive_button_hover_bg": "#c94b4b",
+}
+
+_LIGHT_TOKENS = {
+    "root_window_bg": "#eef3f8",
+    "hero_card_gradient_start": "#ffffff",
+    "hero_card_gradient_end": "#edf4fb",
+    "hero_card_border": "rgba(44, 89, 132, 0.20)",
+    "title_label_fg": "#12395d",
+    "subtitle_label_fg": "#4d6782",
+    "status_label_fg": "#1f486b",
+    "subtle_label_fg": "#53708d",
+    "battery_summary_fg": "#1f4264",
+    "section_hint_fg": "#5e7892",
+    "status_pill_border": "rgba(43, 93, 141, 0.35)",
+    "status_pill_bg": "rgba(72, 111, 147, 0.12)",
+    "status_pill_fg": "#28527a",
+    "status_pill_connected_bg": "rgba(20, 151, 124, 0.14)",
+    "status_pill_connected_border": "rgba(20, 151, 124, 0.45)",
+    "status_pill_connected_fg": "#0f7d69",
+    "status_pill_disconnected_bg": "rgba(191, 81, 81, 0.12)",
+    "status_pill_disconnected_border": "rgba(191, 81, 81, 0.40)",
+    "status_pill_disconnected_fg": "#9d3a3a",
+    "status_pill_busy_bg": "rgba(191, 141, 43, 0.14)",
+    "status_pill_busy_border": "rgba(191, 141, 43, 0.42)",
+    "status_pill_busy_fg": "#8a650f",
+    "label_fg": "#1b3b5c",
+    "card_bg": "#ffffff",
+    "card_border": "rgba(46, 87, 126, 0.16)",
+    "card_title_fg": "#284f74",
+    "combo_bg": "#ffffff",
+    "combo_fg": "#143a59",
+    "combo_border": "#b0c5d8",
+    "combo_hover_border": "#6a99c4",
+    "combo_popup_bg": "#ffffff",
+    "combo_popup_fg": "#143a59",
+    "combo_popup_border": "#aac0d3",
+    "combo_popup_selection_bg": "#d5e8f8",
+    "battery_bar_bg": "#d6e2ee",
+    "battery_bar_border": "rgba(46, 87, 126, 0.20)",
+    "battery_bar_chunk_bg": "#20a17f",
+    "battery_bar_disconnected_chunk_bg": "#8ca0b4",
+    "battery_bar_busy_chunk_bg": "#c79a3a",
+    "soft_button_bg": "rgba(33, 102, 163, 0.10)",
+    "soft_button_fg": "#1f5b8f",
+    "soft_button_border": "rgba(33, 102, 163, 0.18)",
+    "soft_button_hover_bg": "rgba(33, 102, 163, 0.16)",
+    "destructive_button_bg": "#e4684d",
+    "destructive_button_border": "#cd4e35",
+    "destructive_button_hover_bg": "#d95b40",
+}
+
+_QSS_DARK = _QSS_TEMPLATE.substitute(_DARK_TOKENS)
+_QSS_LIGHT = _QSS_TEMPLATE.substitute(_LIGHT_TOKENS)
+
+_SWITCH_COLORS_DARK = (
+    QtGui.QColor("#6ee7b7"),
+    QtGui.QColor("#334155"),
+    QtGui.QColor("#f8fafc"),
+)
+_SWITCH_COLORS_LIGHT = (
+    QtGui.QColor("#19a79a"),
+    QtGui.QColor("#b5c8d9"),
+    QtGui.QColor("#ffffff"),
+)
+
+
+@functools.lru_cache(maxsize=2)
+def _build_palette(dark):
+    palette = QtWidgets.QApplication.style().standardPalette()
+    if dark:
+        palette.setColor(QtGui.QPalette.Window, QtGui.QColor("#0f141a"))
+        palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#e6edf3"))
+        palette.setColor(QtGui.QPalette.Base, QtGui.QColor("#111827"))
+        palette.setColor(QtGui.QPalette.Text, QtGui.QColor("#e6edf3"))
+        palette.setColor(QtGui.QPalette.Button, QtGui.QColor("#1f2937"))
+        palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#e6edf3"))
+        palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#1f6aa5"))
+        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#ffffff"))
+    else:
+        palette.setColor(QtGui.QPalette.Window, QtGui.QColor("#f4f8fc"))
+        palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#14273f"))
+        palette.setColor(QtGui.QPalette.Base, QtGui.QColor("#ffffff"))
+        palette.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#ecf3fa"))
+        palette.setColor(QtGui.QPalette.Text, QtGui.QColor("#14273f"))
+        palette.setColor(QtGui.QPalette.Button, QtGui.QColor("#eaf2f9"))
+        palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#123a5d"))
+        palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#2f7ab8"))
+        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#ffffff"))
+    return palette
+
+
+def _brush(color):
+    if not isinstance(color, QtGui.QColor):
+        color = QtGui.QColor(color)
+    return QtGui.QBrush(color)
+
+
+def _scaled_logo_pixmap(path, width):
+    key = f"hyperx-logo-{width}@{path}"
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QtGui.QPixmap(str(path)).scaledToWidth(width, QtCore.Qt.SmoothTransformation)
+        QtGui.QPixmapCache.insert(key, pixmap)
+    return pixmap
+
 
 class LogDialog(QtWidgets.QDialog):
     LOG_LEVELS = ("INFO", "WARN", "DEBUG")
@@ -35,8 +310,13 @@ class LogDialog(QtWidgets.QDialog):
         layout.addLayout(filters)
         self.text = QtWidgets.QPlainTextEdit()
         self.text.setReadOnly(True)
+        self.text.setUndoRedoEnabled(False)
+        self.text.setMaximumBlockCount(LOG_VIEW_MAX_BLOCKS)
         layout.addWidget(self.text)
         self._entries = []
+        self._pending_lines = []
+        self._flush_scheduled = False
+        self._scroll_pending = False
 
     def _selected_levels(self):
         selected = set()
@@ -48,6 +328,10 @@ class LogDialog(QtWidgets.QDialog):
             selected.add("DEBUG")
         return selected
 
+    @staticmethod
+    def _entry_level(entry):
+        return str(entry.get("level", "INFO")).strip().upper() or "INFO"
+
     @staticmethod
     def _format_entry(entry):
         timestamp = str(entry.get("timestamp", "")).strip()
@@ -99,16 +383,30 @@ class LogDialog(QtWidgets.QDialog):
             f"Logs exported to:\n{target_path}",
         )
 
-    def _refresh_view_from_entries(self):
+    def _filtered_lines(self, entries):
         selected = self._selected_levels()
-        lines = []
-        for entry in self._entries:
-            level = str(entry.get("level", "INFO")).strip().upper() or "INFO"
-            if selected and level not in selected:
-                continue
-            lines.append(self._format_entry(entry))
-        self.text.setPlainText("\n".join(lines))
-        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
+        return [
+            self._format_entry(entry)
+            for entry in entries
+            if not selected or self._entry_level(entry) in selected
+        ]
+
+    def _scroll_to_end(self):
+        if not self.isVisible():
+            self._scroll_pending = True
+            return
+        self._scroll_pending = False
+        self.text.moveCursor(_TEXT_END)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._scroll_pending:
+            self._scroll_to_end()
+
+    def _refresh_view_from_entries(self):
+        self._pending_lines.clear()
+        self.text.setPlainText("\n".join(self._filtered_lines(self._entries)))
+        self._scroll_to_end()
 
     def set_entries(self, entries):
         self._entries = list(entries or [])
@@ -117,60 +415,134 @@ class LogDialog(QtWidgets.QDialog):
     def append_entries(self, entries):
         if not entries:
             return
-        self._entries.extend(list(entries))
-        self._refresh_view_from_entries()
+        entries = list(entries)
+        self._entries.extend(entries)
+        self.append_lines(self._filtered_lines(entries))
 
     def set_text(self, text):
         self._entries = []
+        self._pending_lines.clear()
         self.text.setPlainText(text)
-        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
+        self._scroll_to_end()
 
     def append_lines(self, lines):
         if not lines:
             return
-        self.text.appendPlainText("\n".join(lines))
-        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
+        self._pending_lines.extend(lines)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(LOG_VIEW_FLUSH_DELAY_MS, self._flush_pending_lines)
+
+    def _flush_pending_lines(self):
+        self._flush_scheduled = False
+        if not self._pending_lines:
+            return
+        text = "\n".join(self._pending_lines)
+        self._pending_lines.clear()
+        self.text.setUpdatesEnabled(False)
+        self.text.blockSignals(True)
+        try:
+            self.text.appendPlainText(text)
+        finally:
+            self.text.blockSignals(False)
+            self.text.setUpdatesEnabled(True)
+        self._scroll_to_end()
 
     def append_line(self, line):
         self.append_lines([line])
 
 
 class ToggleSwitch(QtWidgets.QAbstractButton):
+    _path_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setCheckable(True)
         self.setCursor(QtCore.Qt.PointingHandCursor)
-        self.setFixedSize(46, 24)
-        self._color_on = QtGui.QColor("#2a9d8f")
-        self._color_off = QtGui.QColor("#cbd5e1")
-        self._knob = QtGui.QColor("#ffffff")
-
-    def set_colors(self, on_color, off_color, knob_color):
-        self._color_on = QtGui.QColor(on_color)
-        self._color_off = QtGui.QColor(off_color)
-        self._knob = QtGui.QColor(knob_color)
-        self.update()
-
-    def paintEvent(self, _event):
-        painter = QtGui.QPainter(self)
+        self.setAttribute(QtCore.Qt.WA_StyledBackground, False)
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, False)
+        self.setFixedSize(TOGGLE_SWITCH_SIZE)
+        self._color_on = QtGui.QBrush(QtGui.QColor("#2a9d8f"))
+        self._color_off = QtGui.QBrush(QtGui.QColor("#cbd5e1"))
+        self._knob = QtGui.QBrush(QtGui.QColor("#ffffff"))
+        self._colors = None
+        self._pixmaps = {}
+
+    def set_colors(self, on_color, off_color, knob_color, *, update=True):
+        colors = (on_color, off_color, knob_color)
+        if colors == self._colors:
+            return False
+        self._colors = colors
+        self._color_on = _brush(on_color)
+        self._color_off = _brush(off_color)
+        self._knob = _brush(knob_color)
+        self._pixmaps.clear()
+        if update:
+            self.update()
+        return True
+
+    def sizeHint(self):
+        return TOGGLE_SWITCH_SIZE
+
+    def minimumSizeHint(self):
+        return TOGGLE_SWITCH_SIZE
+
+    @classmethod
+    def _paths(cls, width, height):
+        key = (width, height)
+        paths = cls._path_cache.get(key)
+        if paths is None:
+            rect = QtCore.QRectF(0, 0, width, height)
+            radius = height / 2.0
+            pill = QtGui.QPainterPath()
+            pill.addRoundedRect(rect.adjusted(0, 0, -1, -1), radius, radius)
+            knob_size = height - 4
+            knob_off = QtGui.QPainterPath()
+            knob_off.addEllipse(QtCore.QRectF(2, 2, knob_size, knob_size))
+            knob_on = QtGui.QPainterPath()
+            knob_on.addEllipse(
+                QtCore.QRectF(width - knob_size - 2, 2, knob_size, knob_size)
+            )
+            paths = (pill, knob_off, knob_on)
+            cls._path_cache[key] = paths
+        return paths
+
+    def _render(self, is_active, checked, ratio):
+        pill, knob_off, knob_on = self._paths(self.width(), self.height())
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        rect = QtCore.QRectF(self.rect())
-        radius = rect.height() / 2.0
         painter.setPen(QtCore.Qt.NoPen)
-        # Disabled switches must not look "active" even if they keep last state.
-        is_active = self.isChecked() and self.isEnabled()
         painter.setBrush(self._color_on if is_active else self._color_off)
-        painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), radius, radius)
-
-        knob_size = rect.height() - 4
-        x = rect.width() - knob_size - 2 if self.isChecked() else 2
-        knob_rect = QtCore.QRectF(x, 2, knob_size, knob_size)
+        painter.drawPath(pill)
         painter.setBrush(self._knob)
-        painter.drawEllipse(knob_rect)
+        painter.drawPath(knob_on if checked else knob_off)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, _event):
+        checked = self.isChecked()
+        # Disabled switches must not look "active" even if they keep last state.
+        is_active = checked and self.isEnabled()
+        ratio = self.devicePixelRatioF()
+        key = (is_active, checked, ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._render(is_active, checked, ratio)
+            self._pixmaps[key] = pixmap
+        QtGui.QPainter(self).drawPixmap(0, 0, pixmap)
 
 
 class HyperxViewMixin:
     def _build_ui(self):
+        self._pending_repolish = set()
+        self._repolish_scheduled = False
+        self._last_status_text = None
+        self._last_badge_text = None
+        self._last_summary_text = None
+        self._last_battery_value = 0
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(22, 20, 22, 20)
         layout.setSpacing(16)
@@ -188,9 +560,8 @@ class HyperxViewMixin:
         logo.setObjectName("brandLogo")
         logo_path = self.icon_dir / "hyperx.png"
         if logo_path.exists():
-            pixmap = QtGui.QPixmap(str(logo_path)).scaledToWidth(172, QtCore.Qt.SmoothTransformation)
-            logo.setPixmap(pixmap)
-            logo.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+            logo.setPixmap(_scaled_logo_pixmap(logo_path, 172))
+            logo.setAlignment(_ALIGN_LEFT_VCENTER)
         brand_col.addWidget(logo)
 
         self.title_label = QtWidgets.QLabel(f"{APP_NAME} Control Center")
@@ -233,40 +604,35 @@ class HyperxViewMixin:
         header_layout.addLayout(status_col, 1)
         layout.addWidget(header_card)
 
-        content_layout = QtWidgets.QHBoxLayout()
-        content_layout.setSpacing(16)
-        layout.addLayout(content_layout, 1)
-
-        left_column = QtWidgets.QVBoxLayout()
-        left_column.setSpacing(14)
-        right_column = QtWidgets.QVBoxLayout()
-        right_column.setSpacing(14)
-        content_layout.addLayout(left_column, 3)
-        content_layout.addLayout(right_column, 2)
-
-        features = QtWidgets.QGroupBox("Headset Controls")
-        features.setObjectName("card")
-        features_layout = QtWidgets.QFormLayout(features)
-        features_layout.setLabelAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-        features_layout.setHorizontalSpacing(16)
-        features_layout.setVerticalSpacing(12)
+        content_grid = QtWidgets.QGridLayout()
+        content_grid.setHorizontalSpacing(16)
+        content_grid.setVerticalSpacing(14)
+        content_grid.setColumnStretch(0, 3)
+        content_grid.setColumnStretch(1, 2)
+        content_grid.setRowStretch(2, 1)
+        layout.addLayout(content_grid, 1)
 
         self.sleep_combo = QtWidgets.QComboBox()
         self.sleep_combo.addItems(["10 Minutes", "20 Minutes", "30 Minutes"])
-        self.sleep_combo.currentIndexChanged.connect(self._on_sleep_changed)
 
         self.voice_switch = ToggleSwitch()
-        self.voice_switch.toggled.connect(self._on_voice_toggle)
 
         self.mic_switch = ToggleSwitch()
         if self.settings.mic_monitor_state is not None:
             self.mic_switch.setChecked(bool(self.settings.mic_monitor_state))
-        self.mic_switch.toggled.connect(self._on_mic_toggle)
 
-        features_layout.addRow("Sleep Timer", self.sleep_combo)
-        features_layout.addRow("Voice Prompt", self.voice_switch)
-        features_layout.addRow("Mic Monitoring", self.mic_switch)
-        left_column.addWidget(features)
+        content_grid.addWidget(
+            self._make_form_card(
+                "Headset Controls",
+                (
+                    ("Sleep Timer", self.sleep_combo),
+                    ("Voice Prompt", self.voice_switch),
+                    ("Mic Monitoring", self.mic_switch),
+                ),
+            ),
+            0,
+            0,
+        )
 
         session = QtWidgets.QGroupBox("Session Actions")
         session.setObjectName("card")
@@ -286,36 +652,23 @@ class HyperxViewMixin:
         action_grid.setVerticalSpacing(10)
 
         self.min_button = QtWidgets.QPushButton("Minimize to Tray")
-        self.min_button.clicked.connect(self._on_minimize)
         self.min_button.setObjectName("softButton")
 
         self.log_button = QtWidgets.QPushButton("Open Logs")
-        self.log_button.clicked.connect(self._show_logs)
         self.log_button.setObjectName("softButton")
 
         self.quit_button = QtWidgets.QPushButton("Quit")
-        self.quit_button.clicked.connect(self.quit)
         self.quit_button.setObjectName("destructiveButton")
 
         action_grid.addWidget(self.min_button, 0, 0)
         action_grid.addWidget(self.log_button, 0, 1)
         action_grid.addWidget(self.quit_button, 1, 0, 1, 2)
         session_layout.addLayout(action_grid)
-        left_column.addWidget(session)
-        left_column.addStretch(1)
-
-        prefs = QtWidgets.QGroupBox("Device & Preferences")
-        prefs.setObjectName("card")
-        prefs_layout = QtWidgets.QFormLayout(prefs)
-        prefs_layout.setLabelAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-        prefs_layout.setHorizontalSpacing(16)
-        prefs_layout.setVerticalSpacing(12)
+        content_grid.addWidget(session, 1, 0)
 
         self.device_combo = QtWidgets.QComboBox()
-        self.device_combo.currentIndexChanged.connect(self._on_device_selection_changed)
         self.device_refresh_button = QtWidgets.QPushButton("Scan Devices")
         self.device_refresh_button.setObjectName("softButton")
-        self.device_refresh_button.clicked.connect(self._on_scan_devices)
         device_box = QtWidgets.QHBoxLayout()
         device_box.setContentsMargins(0, 0, 0, 0)
         device_box.setSpacing(10)
@@ -326,11 +679,9 @@ class HyperxViewMixin:
 
         self.start_on_login_switch = ToggleSwitch()
         self.start_on_login_switch.setChecked(self.settings.start_on_login)
-        self.start_on_login_switch.toggled.connect(self._on_start_on_login_toggle)
 
         self.start_hidden_switch = ToggleSwitch()
         self.start_hidden_switch.setChecked(self.settings.start_hidden)
-        self.start_hidden_switch.toggled.connect(self._on_start_hidden_toggle)
 
         self.theme_combo = QtWidgets.QComboBox()
         self.theme_combo.addItem("System", "system")
@@ -339,18 +690,24 @@ class HyperxViewMixin:
         index = self.theme_combo.findData(self.settings.theme_mode)
         if index >= 0:
             self.theme_combo.setCurrentIndex(index)
-        self.theme_combo.currentIndexChanged.connect(self._on_theme_changed)
 
         self.notify_switch = ToggleSwitch()
         self.notify_switch.setChecked(self.settings.tray_notifications)
-        self.notify_switch.toggled.connect(self._on_notifications_toggle)
 
-        prefs_layout.addRow("Active Headset", device_widget)
-        prefs_layout.addRow("Start on Login", self.start_on_login_switch)
-        prefs_layout.addRow("Start Hidden (Tray)", self.start_hidden_switch)
-        prefs_layout.addRow("Theme", self.theme_combo)
-        prefs_layout.addRow("Tray Notifications", self.notify_switch)
-        right_column.addWidget(prefs)
+        content_grid.addWidget(
+            self._make_form_card(
+                "Device & Preferences",
+                (
+                    ("Active Headset", device_widget),
+                    ("Start on Login", self.start_on_login_switch),
+                    ("Start Hidden (Tray)", self.start_hidden_switch),
+                    ("Theme", self.theme_combo),
+                    ("Tray Notifications", self.notify_switch),
+                ),
+            ),
+            0,
+            1,
+        )
 
         right_info = QtWidgets.QGroupBox("Status Notes")
         right_info.setObjectName("card")
@@ -365,271 +722,79 @@ class HyperxViewMixin:
         note.setWordWrap(True)
         right_info_layout.addWidget(note)
         right_info_layout.addStretch(1)
-        right_column.addWidget(right_info)
-        right_column.addStretch(1)
+        content_grid.addWidget(right_info, 1, 1)
 
+        self._connect_ui_signals()
         self._set_controls_enabled(False)
+        self._ui_ready = True
         self._set_status_text()
 
-    def _apply_theme(self):
+    def _connect_ui_signals(self):
+        self.sleep_combo.currentIndexChanged.connect(self._on_sleep_changed)
+        self.voice_switch.toggled.connect(self._on_voice_toggle)
+        self.mic_switch.toggled.connect(self._on_mic_toggle)
+        self.min_button.clicked.connect(self._on_minimize)
+        self.log_button.clicked.connect(self._show_logs)
+        self.quit_button.clicked.connect(self.quit)
+        self.device_combo.currentIndexChanged.connect(self._on_device_selection_changed)
+        self.device_refresh_button.clicked.connect(self._on_scan_devices)
+        self.start_on_login_switch.toggled.connect(self._on_start_on_login_toggle)
+        self.start_hidden_switch.toggled.connect(self._on_start_hidden_toggle)
+        self.theme_combo.currentIndexChanged.connect(self._on_theme_changed)
+        self.notify_switch.toggled.connect(self._on_notifications_toggle)
+
+    @staticmethod
+    def _make_form_card(title, rows):
+        card = QtWidgets.QGroupBox(title)
+        card.setObjectName("card")
+        card_layout = QtWidgets.QFormLayout(card)
+        card_layout.setLabelAlignment(_ALIGN_LEFT_VCENTER)
+        card_layout.setHorizontalSpacing(16)
+        card_layout.setVerticalSpacing(12)
+        for label, widget in rows:
+            card_layout.addRow(label, widget)
+        return card
+
+    def _install_app_theme(self):
         dark = self._is_dark_mode()
         self._theme_is_dark = dark
-        app = QtWidgets.QApplication.instance()
-        palette = app.style().standardPalette()
-        if dark:
-            palette.setColor(QtGui.QPalette.Window, QtGui.QColor("#0f141a"))
-            palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#e6edf3"))
-            palette.setColor(QtGui.QPalette.Base, QtGui.QColor("#111827"))
-            palette.setColor(QtGui.QPalette.Text, QtGui.QColor("#e6edf3"))
-            palette.setColor(QtGui.QPalette.Button, QtGui.QColor("#1f2937"))
-            palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#e6edf3"))
-            palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#1f6aa5"))
-            palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#ffffff"))
-        else:
-            palette.setColor(QtGui.QPalette.Window, QtGui.QColor("#f4f8fc"))
-            palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#14273f"))
-            palette.setColor(QtGui.QPalette.Base, QtGui.QColor("#ffffff"))
-            palette.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#ecf3fa"))
-            palette.setColor(QtGui.QPalette.Text, QtGui.QColor("#14273f"))
-            palette.setColor(QtGui.QPalette.Button, QtGui.QColor("#eaf2f9"))
-            palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#123a5d"))
-            palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#2f7ab8"))
-            palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#ffffff"))
-        app.setPalette(palette)
-        app.setStyleSheet(self._stylesheet(dark))
+        app = self._app
+        qss = self._stylesheet(dark)
+        if (
+            getattr(self, "_applied_theme_dark", None) is dark
+            and app.styleSheet() == qss
+        ):
+            return False
+        app.setPalette(_build_palette(dark))
+        app.setStyleSheet(qss)
+        self._applied_theme_dark = dark
+        return True
+
+    def _apply_theme(self):
+        self._install_app_theme()
         self._update_switch_colors()
         self._set_status_text()
 
     def _update_switch_colors(self):
-        if self._theme_is_dark:
-            on_color = "#6ee7b7"
-            off_color = "#334155"
-            knob = "#f8fafc"
-        else:
-            on_color = "#19a79a"
-            off_color = "#b5c8d9"
-            knob = "#ffffff"
-        for switch in (
-            self.voice_switch,
-            self.mic_switch,
-            self.start_on_login_switch,
-            self.start_hidden_switch,
-            self.notify_switch,
-        ):
-            switch.set_colors(on_color, off_color, knob)
+        on_color, off_color, knob = (
+            _SWITCH_COLORS_DARK if self._theme_is_dark else _SWITCH_COLORS_LIGHT
+        )
+        changed = [
+            switch
+            for switch in (
+                self.voice_switch,
+                self.mic_switch,
+                self.start_on_login_switch,
+                self.start_hidden_switch,
+                self.notify_switch,
+            )
+            if switch.set_colors(on_color, off_color, knob, update=False)
+        ]
+        for switch in changed:
+            switch.update()
 
     def _stylesheet(self, dark):
-        if dark:
-            return """
-            QWidget {
-                font-family: 'IBM Plex Sans', 'Source Sans 3', 'Noto Sans', sans-serif;
-                font-size: 13px;
-            }
-            QWidget#rootWindow { background-color: #0a1321; }
-            QFrame#heroCard {
-                background-color: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #101f33, stop:1 #17283f
-                );
-                border: 1px solid rgba(165, 200, 232, 0.20);
-                border-radius: 16px;
-            }
-            #titleLabel { font-size: 23px; font-weight: 700; color: #f8fbff; letter-spacing: 0.2px; }
-            #subtitleLabel { color: #a6bdd6; font-size: 13px; }
-            #statusLabel { color: #d9e8f7; font-size: 15px; font-weight: 600; }
-            #subtleLabel { color: #9ab4ce; font-size: 12px; }
-            #batterySummary { color: #e5eef8; font-weight: 600; }
-            #sectionHint { color: #9fb0c2; font-size: 12px; line-height: 1.35; }
-            QLabel#statusPill {
-                border-radius: 999px;
-                padding: 6px 12px;
-                border: 1px solid rgba(179, 214, 255, 0.38);
-                font-weight: 700;
-                background-color: rgba(40, 70, 100, 0.35);
-                color: #dceaf9;
-            }
-            QLabel#statusPill[state="connected"] {
-                background-color: rgba(37, 148, 120, 0.22);
-                border-color: rgba(130, 247, 206, 0.60);
-                color: #9ff8d8;
-            }
-            QLabel#statusPill[state="disconnected"] {
-                background-color: rgba(128, 80, 80, 0.22);
-                border-color: rgba(255, 178, 178, 0.45);
-                color: #ffd2d2;
-            }
-            QLabel#statusPill[state="busy"] {
-                background-color: rgba(196, 140, 53, 0.22);
-                border-color: rgba(255, 213, 137, 0.50);
-                color: #ffe3a8;
-            }
-            QLabel { color: #e7f0fb; }
-            QGroupBox#card {
-                background-color: #101b2d;
-                border: 1px solid rgba(165, 195, 225, 0.22);
-                border-radius: 14px;
-                margin-top: 13px;
-                padding-top: 8px;
-            }
-            QGroupBox#card::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 12px;
-                padding: 0 8px;
-                color: #d0e2f6;
-                font-weight: 700;
-            }
-            QComboBox {
-                background-color: #0d1727;
-                color: #e6f0fb;
-                border: 1px solid rgba(150, 182, 214, 0.45);
-                border-radius: 8px;
-                padding: 5px 26px 5px 10px;
-                min-height: 30px;
-            }
-            QComboBox:hover { border-color: #77a8d9; }
-            QComboBox::drop-down { border: none; width: 24px; }
-            QComboBox QAbstractItemView {
-                background-color: #0f1c30;
-                color: #e8f1fb;
-                border: 1px solid #2e4664;
-                selection-background-color: #2e5d8c;
-            }
-            QProgressBar#batteryBar {
-                background-color: #2a3a4d;
-                border: 1px solid rgba(168, 196, 224, 0.30);
-                border-radius: 5px;
-            }
-            QProgressBar#batteryBar::chunk {
-                border-radius: 5px;
-                background-color: #58c7a2;
-            }
-            QProgressBar#batteryBar[state="disconnected"]::chunk { background-color: #64748b; }
-            QProgressBar#batteryBar[state="busy"]::chunk { background-color: #d4a44f; }
-            QPushButton {
-                min-height: 34px;
-                border-radius: 9px;
-                padding: 6px 10px;
-                font-weight: 600;
-            }
-            QPushButton#softButton {
-                background-color: rgba(112, 192, 255, 0.16);
-                color: #cbe6ff;
-                border: 1px solid rgba(112, 192, 255, 0.32);
-            }
-            QPushButton#softButton:hover { background-color: rgba(112, 192, 255, 0.25); }
-            QPushButton#destructiveButton {
-                background-color: #d95858;
-                color: white;
-                border: 1px solid #c74444;
-            }
-            QPushButton#destructiveButton:hover { background-color: #c94b4b; }
-            """
-        return """
-            QWidget {
-                font-family: 'IBM Plex Sans', 'Source Sans 3', 'Noto Sans', sans-serif;
-                font-size: 13px;
-            }
-            QWidget#rootWindow { background-color: #eef3f8; }
-            QFrame#heroCard {
-                background-color: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #ffffff, stop:1 #edf4fb
-                );
-                border: 1px solid rgba(44, 89, 132, 0.20);
-                border-radius: 16px;
-            }
-            #titleLabel { font-size: 23px; font-weight: 700; color: #12395d; letter-spacing: 0.2px; }
-            #subtitleLabel { color: #4d6782; font-size: 13px; }
-            #statusLabel { color: #1f486b; font-size: 15px; font-weight: 600; }
-            #subtleLabel { color: #53708d; font-size: 12px; }
-            #batterySummary { color: #1f4264; font-weight: 600; }
-            #sectionHint { color: #5e7892; font-size: 12px; line-height: 1.35; }
-            QLabel#statusPill {
-                border-radius: 999px;
-                padding: 6px 12px;
-                border: 1px solid rgba(43, 93, 141, 0.35);
-                font-weight: 700;
-                background-color: rgba(72, 111, 147, 0.12);
-                color: #28527a;
-            }
-            QLabel#statusPill[state="connected"] {
-                background-color: rgba(20, 151, 124, 0.14);
-                border-color: rgba(20, 151, 124, 0.45);
-                color: #0f7d69;
-            }
-            QLabel#statusPill[state="disconnected"] {
-                background-color: rgba(191, 81, 81, 0.12);
-                border-color: rgba(191, 81, 81, 0.40);
-                color: #9d3a3a;
-            }
-            QLabel#statusPill[state="busy"] {
-                background-color: rgba(191, 141, 43, 0.14);
-                border-color: rgba(191, 141, 43, 0.42);
-                color: #8a650f;
-            }
-            QLabel { color: #1b3b5c; }
-            QGroupBox#card {
-                background-color: #ffffff;
-                border: 1px solid rgba(46, 87, 126, 0.16);
-                border-radius: 14px;
-                margin-top: 13px;
-                padding-top: 8px;
-            }
-            QGroupBox#card::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 12px;
-                padding: 0 8px;
-                color: #284f74;
-                font-weight: 700;
-            }
-            QComboBox {
-                background-color: #ffffff;
-                color: #143a59;
-                border: 1px solid #b0c5d8;
-                border-radius: 8px;
-                padding: 5px 26px 5px 10px;
-                min-height: 30px;
-            }
-            QComboBox:hover { border-color: #6a99c4; }
-            QComboBox::drop-down { border: none; width: 24px; }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                color: #143a59;
-                border: 1px solid #aac0d3;
-                selection-background-color: #d5e8f8;
-            }
-            QProgressBar#batteryBar {
-                background-color: #d6e2ee;
-                border: 1px solid rgba(46, 87, 126, 0.20);
-                border-radius: 5px;
-            }
-            QProgressBar#batteryBar::chunk {
-                border-radius: 5px;
-                background-color: #20a17f;
-            }
-            QProgressBar#batteryBar[state="disconnected"]::chunk { background-color: #8ca0b4; }
-            QProgressBar#batteryBar[state="busy"]::chunk { background-color: #c79a3a; }
-            QPushButton {
-                min-height: 34px;
-                border-radius: 9px;
-                padding: 6px 10px;
-                font-weight: 600;
-            }
-            QPushButton#softButton {
-                background-color: rgba(33, 102, 163, 0.10);
-                color: #1f5b8f;
-                border: 1px solid rgba(33, 102, 163, 0.18);
-            }
-            QPushButton#softButton:hover { background-color: rgba(33, 102, 163, 0.16); }
-            QPushButton#destructiveButton {
-                background-color: #e4684d;
-                color: white;
-                border: 1px solid #cd4e35;
-            }
-            QPushButton#destructiveButton:hover { background-color: #d95b40; }
-            """
+        return _QSS_DARK if dark else _QSS_LIGHT
 
     def _is_dark_mode(self):
         mode = self.settings.theme_mode
@@ -641,20 +806,36 @@ class HyperxViewMixin:
 
     def _system_prefers_dark(self):
         try:
-            hints = QtGui.QGuiApplication.styleHints()
+            hints = self._style_hints
+            if hints is None:
+                hints = QtGui.QGuiApplication.styleHints()
+                self._style_hints = hints
             if hasattr(hints, "colorScheme"):
                 scheme = hints.colorScheme()
-                if scheme == QtCore.Qt.ColorScheme.Dark:
+                if scheme == _SCHEME_DARK:
                     return True
-                if scheme == QtCore.Qt.ColorScheme.Light:
+                if scheme == _SCHEME_LIGHT:
                     return False
         except (AttributeError, RuntimeError, TypeError):
             pass
         palette = QtWidgets.QApplication.palette()
-        window = palette.color(QtGui.QPalette.Window)
+        window = palette.color(_ROLE_WINDOW)
         luminance = (0.2126 * window.red()) + (0.7152 * window.green()) + (0.0722 * window.blue())
         return luminance < 128
 
+    def _schedule_repolish(self, widget):
+        self._pending_repolish.add(widget)
+        if not self._repolish_scheduled:
+            self._repolish_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_repolish)
+
+    def _flush_repolish(self):
+        self._repolish_scheduled = False
+        widgets = self._pending_repolish
+        self._pending_repolish = set()
+        for widget in widgets:
+            self._refresh_widget_style(widget)
+
     @staticmethod
     def _refresh_widget_style(widget):
         if widget is None:
@@ -698,19 +879,21 @@ class HyperxViewMixin:
         self.mic_switch.setEnabled(mic_state)
 
     def _set_status_text(self):
+        if not self._ui_ready:
+            return
         connected = self.status == ConnectionStatus.CONNECTED
         busy = bool(getattr(self, "_control_channel_busy", False))
         if busy:
-            self.status_label.setText("Control Channel Busy")
+            status_text = "Control Channel Busy"
         elif connected and self.battery is not None:
-            self.status_label.setText(f"Battery: {self.battery}%")
+            status_text = f"Battery: {self.battery}%"
         elif connected:
-            self.status_label.setText("Connected")
+            status_text = "Connected"
         else:
-            self.status_label.setText("Disconnected")
-
-        if not hasattr(self, "connection_badge"):
-            return
+            status_text = "Disconnected"
+        if status_text != self._last_status_text:
+            self._last_status_text = status_text
+            self.status_label.setText(status_text)
 
         if busy:
             badge_state = "busy"
@@ -721,30 +904,35 @@ class HyperxViewMixin:
         else:
             badge_state = "disconnected"
             badge_text = "Disconnected"
-        self.connection_badge.setText(badge_text)
+        if badge_text != self._last_badge_text:
+            self._last_badge_text = badge_text
+            self.connection_badge.setText(badge_text)
         if self.connection_badge.property("state") != badge_state:
             self.connection_badge.setProperty("state", badge_state)
-            self._refresh_widget_style(self.connection_badge)
-
-        if not hasattr(self, "battery_summary_label") or not hasattr(self, "battery_progress"):
-            return
+            self._schedule_repolish(self.connection_badge)
 
         if busy:
-            self.battery_summary_label.setText(
+            summary_text = (
                 "Headset detected, but telemetry is busy (Discord/game may be using it)."
             )
-            self.battery_progress.setValue(0)
+            battery_value = 0
         elif connected and self.battery is not None:
             hours = self.battery * 3
-            self.battery_summary_label.setText(f"{self.battery}% (about {hours}h remaining)")
-            self.battery_progress.setValue(self.battery)
+            summary_text = f"{self.battery}% (about {hours}h remaining)"
+            battery_value = self.battery
         elif connected:
-            self.battery_summary_label.setText("Reading headset battery...")
-            self.battery_progress.setValue(0)
+            summary_text = "Reading headset battery..."
+            battery_value = 0
         else:
-            self.battery_summary_label.setText("Headset powered off")
-            self.battery_progress.setValue(0)
+            summary_text = "Headset powered off"
+            battery_value = 0
+        if summary_text != self._last_summary_text:
+            self._last_summary_text = summary_text
+            self.battery_summary_label.setText(summary_text)
+        if battery_value != self._last_battery_value:
+            self._last_battery_value = battery_value
+            self.battery_progress.setValue(battery_value)
 
         if self.battery_progress.property("state") != badge_state:
             self.battery_progress.setProperty("state", badge_state)
-            self._refresh_widget_style(self.battery_progress)
+            self._schedule_repolish(self.battery_progress)
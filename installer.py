@@ -1,7 +1,11 @@
 import argparse
+import fcntl
+import functools
+import hashlib
 import json
 import os
 import re
+import select
 import signal
 import shutil
 import subprocess
@@ -9,11 +13,13 @@ import sys
 import tempfile
 import time
 from pathlib import Path
+from types import MappingProxyType
 import pwd
 import ctypes
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 UDEV_RULE_PATH = "/etc/udev/rules.d/50-hyperxalpha.rules"
 UDEV_RULE_LINES = [
@@ -23,8 +29,13 @@ UDEV_RULE_LINES = [
 UDEV_RULE_CONTENT = "# HyperX Alpha Wireless permissions\n" + "\n".join(
     UDEV_RULE_LINES
 ) + "\n"
+_UDEV_RULE_LINE_SET = frozenset(UDEV_RULE_LINES)
+_UDEV_RULE_DIGEST = hashlib.sha256(UDEV_RULE_CONTENT.encode("utf-8")).digest()
 STATE_DIR = "/var/lib/hyperxalpha"
 RECEIPT_PATH = f"{STATE_DIR}/install-receipt.json"
+RELEASES_CACHE_PATH = f"{STATE_DIR}/releases-cache.json"
+UPDATE_CHECK_PATH = f"{STATE_DIR}/update-check.json"
+UPDATE_CHECK_TTL_SECONDS = 6 * 60 * 60
 RUNTIME_ROOT = Path("/opt/hyperxalpha")
 RUNTIME_PACKAGE_DIR = RUNTIME_ROOT / "hyperxalpha"
 LAUNCHER_PATH = Path("/usr/local/bin/hyperxalpha")
@@ -41,17 +52,64 @@ RUNTIME_MODULE_FILES = (
     "ui.py",
     "view.py",
 )
+_RUNTIME_MODULE_FILES_SET = frozenset(RUNTIME_MODULE_FILES)
 RUNTIME_RESOURCE_DIRS = ("assets",)
 GITHUB_DEFAULT_REPO = "Darayavaush-84/HyperxAlpha"
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_TIMEOUT = 5.0
+GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "hyperxalpha-installer",
+}
 GITHUB_RELEASES_PER_PAGE = 10
+GITHUB_RELEASE_FIELDS = (
+    "tag_name",
+    "name",
+    "body",
+    "published_at",
+    "html_url",
+    "draft",
+    "prerelease",
+)
 GITHUB_MAX_CHANGELOG_RELEASES = 3
 GITHUB_MAX_CHANGELOG_LINES = 10
+FICLONE = 0x40049409
+CMDLINE_READ_SIZE = 4096
 _SEMVER_RE = re.compile(r"^[vV]?(\d+)\.(\d+)\.(\d+)(?:[-+].*)?$")
+_GITHUB_URL_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$",
+        r"^git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$",
+        r"^ssh://git@github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$",
+    )
+)
+_VERSION_RE = re.compile(r"__version__\s*=\s*['\"]([^'\"]+)['\"]")
+_MD_CODE_RE = re.compile(r"`([^`]+)`")
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_MD_INLINE_RE = re.compile(
+    r"(?P<head>^#{1,6}\s*)"
+    r"|`(?P<code>[^`]+)`"
+    r"|\[(?P<text>[^\]]+)\]\((?P<url>[^)]+)\)"
+)
+_MD_OL_RE = re.compile(r"^\d+\.\s+")
+
+
+@functools.lru_cache(maxsize=1)
+def _effective_uid():
+    return os.geteuid()
 
 
-def _source_python_modules(source_package_dir):
+def _source_package_entries(source_package_dir):
+    with os.scandir(source_package_dir) as entries:
+        return {entry.name: entry for entry in entries}
+
+
+def _source_python_modules(source_entries):
     return sorted(
-        path.name for path in source_package_dir.glob("*.py") if path.is_file()
+        name
+        for name, entry in source_entries.items()
+        if name.endswith(".py") and not name.startswith(".") and entry.is_file()
     )
 
 
@@ -61,19 +119,15 @@ def _extract_github_repo(remote_url):
     candidate = str(remote_url).strip()
     if not candidate:
         return None
-    patterns = (
-        r"^https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$",
-        r"^git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$",
-        r"^ssh://git@github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$",
-    )
-    for pattern in patterns:
-        matched = re.match(pattern, candidate)
+    for pattern in _GITHUB_URL_RES:
+        matched = pattern.match(candidate)
         if matched:
             owner, repo = matched.groups()
             return f"{owner}/{repo}"
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _resolve_github_repo():
     from_env = os.environ.get("HYPERX_GITHUB_REPO", "").strip()
     if from_env:
@@ -96,56 +150,99 @@ def _resolve_github_repo():
     return GITHUB_DEFAULT_REPO
 
 
+@functools.lru_cache(maxsize=1)
 def _read_local_version():
     init_path = SOURCE_PACKAGE_DIR / "__init__.py"
     try:
         content = init_path.read_text(encoding="utf-8")
     except OSError:
         return "0.0.0"
-    matched = re.search(r"__version__\s*=\s*['\"]([^'\"]+)['\"]", content)
+    matched = _VERSION_RE.search(content)
     if not matched:
         return "0.0.0"
     return matched.group(1).strip()
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_semver(version):
     if not isinstance(version, str):
         return None
-    matched = _SEMVER_RE.match(version.strip())
+    text = version.strip()
+    parts = (text[1:] if text[:1] in ("v", "V") else text).split(".")
+    if len(parts) == 3 and all(part.isdecimal() for part in parts):
+        return tuple(int(part) for part in parts)
+    matched = _SEMVER_RE.match(text)
     if not matched:
         return None
     return tuple(int(part) for part in matched.groups())
 
 
+@functools.lru_cache(maxsize=4)
 def _fetch_github_releases(repo, per_page=GITHUB_RELEASES_PER_PAGE):
     safe_repo = urllib.parse.quote(repo, safe="/")
     safe_page = max(1, int(per_page))
-    url = (
-        f"https://api.github.com/repos/{safe_repo}/releases"
-        f"?per_page={safe_page}"
-    )
-    request = urllib.request.Request(
-        url,
-        headers={
-            "Accept": "application/vnd.github+json",
-            "User-Agent": "hyperxalpha-installer",
-        },
-    )
+    path = f"/repos/{safe_repo}/releases?per_page={safe_page}"
+    cached_etag, cached_payload = _read_releases_cache(path)
+    request_headers = dict(GITHUB_API_HEADERS)
+    if cached_etag:
+        request_headers["If-None-Match"] = cached_etag
+    request = urllib.request.Request(GITHUB_API_URL + path, headers=request_headers)
     try:
-        with urllib.request.urlopen(request, timeout=5.0) as response:
-            payload = json.loads(response.read().decode("utf-8", errors="replace"))
+        with urllib.request.urlopen(request, timeout=GITHUB_API_TIMEOUT) as response:
+            headers = response.headers
+            body = response.read()
     except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cached_payload is not None:
+            return cached_payload, None
         return None, f"GitHub API HTTP {exc.code}"
     except urllib.error.URLError as exc:
         return None, f"GitHub API unreachable: {exc.reason}"
-    except (OSError, ValueError, json.JSONDecodeError) as exc:
+    except OSError as exc:
+        return None, f"Invalid GitHub API response: {exc}"
+    try:
+        payload = json.loads(body.decode("utf-8", errors="replace"))
+    except ValueError as exc:
         return None, f"Invalid GitHub API response: {exc}"
 
     if not isinstance(payload, list):
         return None, "Unexpected GitHub API payload."
+    # Keep only the fields the update check reads, so the assets, author and
+    # reactions trees are not held or written to the cache.
+    payload = [
+        {key: item.get(key) for key in GITHUB_RELEASE_FIELDS}
+        if isinstance(item, dict)
+        else item
+        for item in payload
+    ]
+    etag = headers.get("ETag")
+    if etag:
+        _write_releases_cache(path, etag, payload)
     return payload, None
 
 
+def _read_releases_cache(path):
+    try:
+        with open(RELEASES_CACHE_PATH, "r", encoding="utf-8") as handle:
+            cached = json.load(handle)
+    except (OSError, ValueError):
+        return None, None
+    if not isinstance(cached, dict) or cached.get("path") != path:
+        return None, None
+    etag = cached.get("etag")
+    payload = cached.get("payload")
+    if not isinstance(etag, str) or not isinstance(payload, list):
+        return None, None
+    return etag, payload
+
+
+def _write_releases_cache(path, etag, payload):
+    data = {"path": path, "etag": etag, "payload": payload, "fetched_at": time.time()}
+    try:
+        _write_json_atomic(RELEASES_CACHE_PATH, data, prefix="releases-cache-")
+    except (OSError, ValueError):
+        pass
+
+
 def _collect_stable_semver_releases(payload):
     releases = []
     for item in payload:
@@ -188,16 +285,25 @@ def _format_release_date(published_at):
     return text or "unknown-date"
 
 
+def _replace_markdown_inline(matched):
+    if matched.group("head") is not None:
+        return ""
+    code = matched.group("code")
+    if code is not None:
+        return _MD_LINK_RE.sub(r"\1 (\2)", code)
+    text = _MD_CODE_RE.sub(r"\1", matched.group("text"))
+    url = _MD_CODE_RE.sub(r"\1", matched.group("url"))
+    return f"{text} ({url})"
+
+
 def _normalize_changelog_line(text):
     line = str(text).strip()
     if not line:
         return ""
-    line = re.sub(r"^#{1,6}\s*", "", line)
-    line = re.sub(r"`([^`]+)`", r"\1", line)
-    line = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1 (\2)", line)
+    line = _MD_INLINE_RE.sub(_replace_markdown_inline, line)
     if line.startswith(("- ", "* ", "+ ")):
         return "- " + line[2:].strip()
-    if re.match(r"^\d+\.\s+", line):
+    if _MD_OL_RE.match(line):
         return line
     return "- " + line
 
@@ -268,22 +374,68 @@ def _check_for_github_updates_before_install():
         return True
 
     repo = _resolve_github_repo()
+    if _recent_update_check_passed(repo, local_version):
+        return True
+
     payload, error = _fetch_github_releases(repo)
     if error is not None:
         print(f"Update check skipped: {error}.")
         return True
 
     releases = _collect_stable_semver_releases(payload)
+    newer = _newer_releases(local_version, releases)
+    _record_update_check(
+        repo,
+        local_version,
+        releases[0]["tag_name"] if releases else None,
+        not newer,
+    )
     if not releases:
         print("Update check: no stable semantic GitHub releases found.")
         return True
 
-    newer = _newer_releases(local_version, releases)
     if not newer:
         return True
     return _prompt_continue_with_update(local_version, newer)
 
 
+def _recent_update_check_passed(repo, local_version):
+    if os.environ.get("HYPERX_FORCE_UPDATE_CHECK", "").strip() == "1":
+        return False
+    try:
+        with open(UPDATE_CHECK_PATH, "r", encoding="utf-8") as handle:
+            cached = json.load(handle)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(cached, dict):
+        return False
+    checked_at = cached.get("checked_at")
+    if not isinstance(checked_at, (int, float)):
+        return False
+    age = time.time() - checked_at
+    return (
+        0 <= age < UPDATE_CHECK_TTL_SECONDS
+        and cached.get("repo") == repo
+        and cached.get("local_version") == local_version
+        and cached.get("up_to_date") is True
+    )
+
+
+def _record_update_check(repo, local_version, latest_tag, up_to_date):
+    data = {
+        "checked_at": time.time(),
+        "repo": repo,
+        "local_version": local_version,
+        "latest_tag": latest_tag,
+        "up_to_date": up_to_date,
+    }
+    try:
+        _write_json_atomic(UPDATE_CHECK_PATH, data, prefix="update-check-")
+    except (OSError, ValueError):
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def _read_os_release():
     data = {}
     try:
@@ -295,8 +447,8 @@ def _read_os_release():
                 key, value = line.split("=", 1)
                 data[key] = value.strip().strip('"')
     except OSError:
-        return {}
-    return data
+        return MappingProxyType({})
+    return MappingProxyType(data)
 
 
 def _is_ubuntu_like():
@@ -326,7 +478,7 @@ def _check_qt():
 
 
 def _apt_install(packages):
-    sudo = [] if os.geteuid() == 0 else ["sudo"]
+    sudo = [] if _effective_uid() == 0 else ["sudo"]
     cmd = sudo + ["apt-get", "install", "-y"] + list(packages)
     try:
         subprocess.run(cmd, check=True)
@@ -358,21 +510,27 @@ def _reload_udev_rules():
 
 
 def _install_udev_rule():
-    if os.geteuid() != 0:
+    if _effective_uid() != 0:
         print("Skipping udev rule install (run the installer with sudo).")
         return False
 
-    existing = ""
+    existing_raw = b""
     try:
-        with open(UDEV_RULE_PATH, "r", encoding="utf-8") as handle:
-            existing = handle.read()
+        with open(UDEV_RULE_PATH, "rb") as handle:
+            existing_raw = handle.read()
     except FileNotFoundError:
         pass
     except OSError as exc:
         print(f"Failed to read {UDEV_RULE_PATH}: {exc}")
         return False
 
-    if existing and all(line in existing for line in UDEV_RULE_LINES):
+    if hashlib.sha256(existing_raw).digest() == _UDEV_RULE_DIGEST:
+        print("udev rule already present.")
+        return True
+    existing = existing_raw.decode("utf-8", errors="replace")
+    if existing and _UDEV_RULE_LINE_SET.issubset(
+        line.strip() for line in existing.splitlines()
+    ):
         print("udev rule already present.")
         return True
 
@@ -394,15 +552,31 @@ def _escape_desktop_value(value):
     return value.replace("\\", "\\\\").replace(" ", "\\ ")
 
 
+def _copy_runtime_file(src, dst):
+    # Reflink (copy-on-write clone) where the filesystem supports it, so staging
+    # moves no file data; otherwise fall back to a regular copy.
+    try:
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+    except OSError:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
 def _install_runtime_files():
     source_package_dir = SOURCE_PACKAGE_DIR
-    if not source_package_dir.is_dir():
+    try:
+        source_entries = _source_package_entries(source_package_dir)
+    except OSError:
         print(f"Source package directory not found: {source_package_dir}")
         return False
 
-    discovered_modules = set(_source_python_modules(source_package_dir))
-    whitelist_modules = set(RUNTIME_MODULE_FILES)
-    missing_from_whitelist = sorted(discovered_modules - whitelist_modules)
+    missing_from_whitelist = [
+        name
+        for name in _source_python_modules(source_entries)
+        if name not in _RUNTIME_MODULE_FILES_SET
+    ]
     if missing_from_whitelist:
         print(
             "Runtime module whitelist is outdated. "
@@ -424,18 +598,25 @@ def _install_runtime_files():
         staging_package_dir.mkdir(parents=True, exist_ok=True)
 
         for module_name in RUNTIME_MODULE_FILES:
-            src_file = source_package_dir / module_name
-            if not src_file.is_file():
-                print(f"Missing runtime module file: {src_file}")
+            entry = source_entries.get(module_name)
+            if entry is None or not entry.is_file():
+                print(f"Missing runtime module file: {source_package_dir / module_name}")
                 return False
-            shutil.copy2(src_file, staging_package_dir / module_name)
+            _copy_runtime_file(entry.path, staging_package_dir / module_name)
 
         for resource_dir in RUNTIME_RESOURCE_DIRS:
-            src_dir = source_package_dir / resource_dir
-            if not src_dir.is_dir():
-                print(f"Missing runtime resource directory: {src_dir}")
+            entry = source_entries.get(resource_dir)
+            if entry is None or not entry.is_dir():
+                print(
+                    "Missing runtime resource directory: "
+                    f"{source_package_dir / resource_dir}"
+                )
                 return False
-            shutil.copytree(src_dir, staging_package_dir / resource_dir)
+            shutil.copytree(
+                entry.path,
+                staging_package_dir / resource_dir,
+                copy_function=_copy_runtime_file,
+            )
 
         if backup_dir.exists():
             shutil.rmtree(backup_dir)
@@ -543,7 +724,7 @@ def _install_desktop_entry():
         gid = user_info.pw_gid
     else:
         app_dir = Path.home() / ".local" / "share" / "applications"
-        uid = os.geteuid()
+        uid = _effective_uid()
         gid = os.getegid()
 
     try:
@@ -642,12 +823,21 @@ def _check_hidraw_lib():
 
 
 def _read_cmdline_tokens(pid):
-    path = Path("/proc") / str(pid) / "cmdline"
     try:
-        raw = path.read_bytes()
-    except (FileNotFoundError, PermissionError, OSError):
+        fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return []
+    try:
+        chunks = [os.read(fd, CMDLINE_READ_SIZE)]
+        while len(chunks[-1]) == CMDLINE_READ_SIZE:
+            chunks.append(os.read(fd, CMDLINE_READ_SIZE))
+    except OSError:
         return []
-    if not raw:
+    finally:
+        os.close(fd)
+    raw = b"".join(chunks)
+    # Every form _is_hyperxalpha_cmdline accepts contains this substring.
+    if b"hyperxalpha" not in raw:
         return []
     return [
         token for token in raw.decode("utf-8", errors="ignore").split("\x00") if token
@@ -655,15 +845,16 @@ def _read_cmdline_tokens(pid):
 
 
 def _is_python_command(token):
-    return Path(token).name.lower().startswith("python")
+    return token.rpartition("/")[2][:6].lower() == "python"
 
 
+@functools.lru_cache(maxsize=1)
 def _candidate_launcher_tokens():
     tokens = {str(LAUNCHER_PATH)}
     found = shutil.which("hyperxalpha")
     if found:
         tokens.add(found)
-    return tokens
+    return frozenset(tokens)
 
 
 def _is_hyperxalpha_cmdline(tokens, launcher_tokens=None):
@@ -676,7 +867,7 @@ def _is_hyperxalpha_cmdline(tokens, launcher_tokens=None):
             return True
         if (
             len(tokens) >= 3
-            and Path(tokens[0]).name == "env"
+            and tokens[0].rpartition("/")[2] == "env"
             and _is_python_command(tokens[1])
             and tokens[2] in launcher_tokens
         ):
@@ -692,26 +883,61 @@ def _is_hyperxalpha_cmdline(tokens, launcher_tokens=None):
 
 def _running_hyperxalpha_pids(launcher_tokens=None):
     pids = []
-    proc_root = Path("/proc")
+    own_pid = os.getpid()
     try:
-        entries = list(proc_root.iterdir())
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.isdigit():
+                    continue
+                pid = int(name)
+                if pid == own_pid:
+                    continue
+                if _is_hyperxalpha_cmdline(
+                    _read_cmdline_tokens(pid),
+                    launcher_tokens=launcher_tokens,
+                ):
+                    pids.append(pid)
     except OSError:
         return []
-    for entry in entries:
-        if not entry.name.isdigit():
-            continue
-        pid = int(entry.name)
-        if pid == os.getpid():
-            continue
-        if _is_hyperxalpha_cmdline(
-            _read_cmdline_tokens(pid),
-            launcher_tokens=launcher_tokens,
-        ):
-            pids.append(pid)
-    return sorted(set(pids))
+    return sorted(pids)
 
 
 def _wait_for_exit(pids, timeout_seconds):
+    try:
+        return _wait_for_exit_pidfd(pids, timeout_seconds)
+    except (AttributeError, OSError):
+        return _poll_for_exit(pids, timeout_seconds)
+
+
+def _wait_for_exit_pidfd(pids, timeout_seconds):
+    deadline = time.monotonic() + timeout_seconds
+    pidfds = {}
+    epoll = select.epoll()
+    try:
+        for pid in pids:
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue
+            pidfds[pidfd] = pid
+            epoll.register(pidfd, select.EPOLLIN)
+        while pidfds:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            for pidfd, _mask in epoll.poll(timeout):
+                epoll.unregister(pidfd)
+                os.close(pidfd)
+                del pidfds[pidfd]
+        return set(pidfds.values())
+    finally:
+        for pidfd in pidfds:
+            os.close(pidfd)
+        epoll.close()
+
+
+def _poll_for_exit(pids, timeout_seconds):
     remaining = set(pids)
     deadline = time.time() + timeout_seconds
     while remaining and time.time() < deadline:
@@ -731,10 +957,15 @@ def _wait_for_exit(pids, timeout_seconds):
 
 
 def _stop_running_app():
-    if os.geteuid() != 0:
+    if _effective_uid() != 0:
         return False, False
 
     launcher_tokens = _candidate_launcher_tokens()
+    # Nothing installed yet (first install): no instance can be using the runtime.
+    if not RUNTIME_PACKAGE_DIR.exists() and not any(
+        os.path.exists(token) for token in launcher_tokens
+    ):
+        return False, True
     pids = _running_hyperxalpha_pids(launcher_tokens=launcher_tokens)
     if not pids:
         return False, True
@@ -763,29 +994,23 @@ def _stop_running_app():
     return True, not remaining
 
 
-def _write_install_receipt(data):
+def _write_json_atomic(path, data, prefix):
     temp_path = None
-    receipt_path = Path(RECEIPT_PATH)
     try:
         Path(STATE_DIR).mkdir(parents=True, exist_ok=True)
         with tempfile.NamedTemporaryFile(
             mode="w",
             encoding="utf-8",
             dir=STATE_DIR,
-            prefix="install-receipt-",
+            prefix=prefix,
             suffix=".json",
             delete=False,
         ) as handle:
+            temp_path = Path(handle.name)
             json.dump(data, handle, indent=2, sort_keys=True)
             handle.flush()
             os.fsync(handle.fileno())
-            temp_path = Path(handle.name)
-        os.replace(temp_path, receipt_path)
-        print(f"Install receipt written to {receipt_path}.")
-        return True
-    except OSError as exc:
-        print(f"Failed to write install receipt: {exc}")
-        return False
+        os.replace(temp_path, path)
     finally:
         if temp_path is not None and temp_path.exists():
             try:
@@ -794,8 +1019,19 @@ def _write_install_receipt(data):
                 pass
 
 
+def _write_install_receipt(data):
+    receipt_path = Path(RECEIPT_PATH)
+    try:
+        _write_json_atomic(receipt_path, data, prefix="install-receipt-")
+    except OSError as exc:
+        print(f"Failed to write install receipt: {exc}")
+        return False
+    print(f"Install receipt written to {receipt_path}.")
+    return True
+
+
 def install_all(scope=None):
-    if os.geteuid() != 0:
+    if _effective_uid() != 0:
         print("Please run the installer with sudo.")
         return False
 
@@ -848,6 +1084,13 @@ def install_all(scope=None):
         print("Package install skipped (unsupported distro).")
         print("Please install the dependencies listed in README.md.")
 
+    # The prerequisite checks print nothing themselves, so they can run while
+    # the install steps below keep their output in order.
+    checks = ThreadPoolExecutor(max_workers=2)
+    qt_check = checks.submit(_check_qt)
+    hidraw_check = checks.submit(_check_hidraw_lib)
+    checks.shutdown(wait=False)
+
     if not _install_udev_rule():
         ok = False
 
@@ -861,14 +1104,14 @@ def install_all(scope=None):
     if desktop_entry_path is None:
         ok = False
 
-    qt_ok, qt_reason = _check_qt()
+    qt_ok, qt_reason = qt_check.result()
     if qt_ok:
         print("PySide6 is available.")
     else:
         print(f"PySide6 not available: {qt_reason}")
         ok = False
 
-    if _check_hidraw_lib():
+    if hidraw_check.result():
         print("hidraw backend available.")
     else:
         print("hidraw backend not found. Install libhidapi-hidraw and retry.")
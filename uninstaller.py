@@ -1,17 +1,31 @@
+import functools
 import json
 import os
 import pwd
+import re
+import select
 import shutil
 import signal
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 UDEV_RULE_PATH = Path("/etc/udev/rules.d/50-hyperxalpha.rules")
 STATE_DIR = Path("/var/lib/hyperxalpha")
 RECEIPT_PATH = STATE_DIR / "install-receipt.json"
+RELEASES_CACHE_PATH = STATE_DIR / "releases-cache.json"
+UPDATE_CHECK_PATH = STATE_DIR / "update-check.json"
 DEFAULT_RUNTIME_ROOT = Path("/opt/hyperxalpha")
 DEFAULT_LAUNCHER_PATH = Path("/usr/local/bin/hyperxalpha")
+REMOVAL_WORKERS = 4
+REMOVED = "removed"
+ABSENT = "absent"
+FAILED = "failed"
+_CMDLINE_RE = re.compile(
+    rb"(?:^|\x00)(?:-m\x00hyperxalpha|[^\x00]*/hyperxalpha/__main__\.py)(?:\x00|\Z)"
+)
 
 
 def _reload_udev_rules():
@@ -27,28 +41,52 @@ def _reload_udev_rules():
     return True
 
 
-def _remove_file(path):
+def _unlink(path):
     try:
         path.unlink()
-        print(f"Removed {path}.")
-        return True
     except FileNotFoundError:
-        return False
+        return ABSENT, None
     except OSError as exc:
-        print(f"Failed to remove {path}: {exc}")
-        return False
+        return FAILED, f"Failed to remove {path}: {exc}"
+    return REMOVED, f"Removed {path}."
 
 
-def _remove_tree(path):
+def _rmtree(path):
     try:
         shutil.rmtree(path)
-        print(f"Removed {path}.")
-        return True
     except FileNotFoundError:
-        return False
+        return ABSENT, None
     except OSError as exc:
-        print(f"Failed to remove {path}: {exc}")
-        return False
+        return FAILED, f"Failed to remove {path}: {exc}"
+    return REMOVED, f"Removed {path}."
+
+
+def _report(result):
+    status, message = result
+    if message:
+        print(message)
+    return status
+
+
+def _remove_file(path):
+    return _report(_unlink(path))
+
+
+def _remove_paths(jobs):
+    # Single files are unlinked in parallel. Trees are removed one at a time
+    # because runtime roots from the receipt may be nested in each other.
+    # Messages are printed in job order either way.
+    results = [None] * len(jobs)
+    parallel = [index for index, (remover, _path) in enumerate(jobs) if remover is _unlink]
+    if parallel:
+        with ThreadPoolExecutor(max_workers=min(REMOVAL_WORKERS, len(parallel))) as executor:
+            unlinked = executor.map(lambda index: _unlink(jobs[index][1]), parallel)
+            for index, result in zip(parallel, unlinked):
+                results[index] = result
+    for index, (remover, path) in enumerate(jobs):
+        if results[index] is None:
+            results[index] = remover(path)
+    return [(path, _report(result)) for (_remover, path), result in zip(jobs, results)]
 
 
 def _read_receipt():
@@ -65,14 +103,9 @@ def _read_receipt():
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def _candidate_homes():
-    homes = {Path.home()}
-    sudo_user = os.environ.get("SUDO_USER")
-    if sudo_user:
-        try:
-            homes.add(Path(pwd.getpwnam(sudo_user).pw_dir))
-        except KeyError:
-            print("Unable to resolve SUDO_USER home directory.")
+    homes = set(_invoking_homes())
     if os.geteuid() == 0:
         try:
             users = pwd.getpwall()
@@ -87,7 +120,7 @@ def _candidate_homes():
             home = Path(user.pw_dir)
             if home.is_absolute():
                 homes.add(home)
-    return sorted(homes)
+    return tuple(sorted(homes))
 
 
 def _install_scope_from_receipt(receipt):
@@ -102,6 +135,7 @@ def _install_scope_from_receipt(receipt):
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _invoking_homes():
     homes = {Path.home()}
     sudo_user = os.environ.get("SUDO_USER")
@@ -110,7 +144,7 @@ def _invoking_homes():
             homes.add(Path(pwd.getpwnam(sudo_user).pw_dir))
         except KeyError:
             print("Unable to resolve SUDO_USER home directory.")
-    return sorted(homes)
+    return tuple(sorted(homes))
 
 
 def _receipt_user_home(receipt):
@@ -152,7 +186,7 @@ def _scoped_homes(receipt):
         return _candidate_homes()
     receipt_home = _receipt_user_home(receipt)
     if receipt_home is not None:
-        return [receipt_home]
+        return (receipt_home,)
     return _invoking_homes()
 
 
@@ -210,72 +244,113 @@ def _receipt_path_if_safe(receipt, key, validator, label):
     return None
 
 
-def _read_cmdline_tokens(pid):
-    path = Path("/proc") / str(pid) / "cmdline"
+def _read_cmdline_raw(pid_name):
     try:
-        raw = path.read_bytes()
-    except (FileNotFoundError, PermissionError, OSError):
-        return []
-    if not raw:
-        return []
-    return [token for token in raw.decode("utf-8", errors="ignore").split("\x00") if token]
+        fd = os.open(f"/proc/{pid_name}/cmdline", os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return b""
+    chunks = []
+    try:
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
+        return b""
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
 
 
-def _candidate_launcher_tokens(receipt):
-    return {str(path) for path in _candidate_launcher_paths(receipt)}
+def _candidate_launcher_tokens(launcher_paths):
+    return {os.fsencode(path) for path in launcher_paths}
 
 
 def _is_python_command(token):
-    name = Path(token).name.lower()
-    return name.startswith("python")
+    return os.path.basename(token).lower().startswith(b"python")
 
 
-def _is_hyperxalpha_cmdline(tokens, launcher_tokens=None):
+def _is_hyperxalpha_cmdline_raw(raw, launcher_tokens=None):
+    if b"hyperxalpha" not in raw:
+        return False
+    if _CMDLINE_RE.search(raw):
+        return True
+    if not launcher_tokens:
+        return False
+    tokens = [token for token in raw.split(b"\x00") if token]
     if not tokens:
         return False
-    if launcher_tokens:
-        if tokens[0] in launcher_tokens:
-            return True
-        if len(tokens) >= 2 and _is_python_command(tokens[0]) and tokens[1] in launcher_tokens:
-            return True
-        if (
-            len(tokens) >= 3
-            and Path(tokens[0]).name == "env"
-            and _is_python_command(tokens[1])
-            and tokens[2] in launcher_tokens
-        ):
-            return True
-    for index, token in enumerate(tokens[:-1]):
-        if token == "-m" and tokens[index + 1] == "hyperxalpha":
-            return True
-    for token in tokens:
-        if token.endswith("/hyperxalpha/__main__.py"):
-            return True
-    return False
+    if tokens[0] in launcher_tokens:
+        return True
+    if len(tokens) >= 2 and _is_python_command(tokens[0]) and tokens[1] in launcher_tokens:
+        return True
+    return (
+        len(tokens) >= 3
+        and os.path.basename(tokens[0]) == b"env"
+        and _is_python_command(tokens[1])
+        and tokens[2] in launcher_tokens
+    )
 
 
 def _running_hyperxalpha_pids(launcher_tokens=None):
-    pids = []
-    proc_root = Path("/proc")
+    pids = set()
+    own_pid = os.getpid()
     try:
-        entries = list(proc_root.iterdir())
+        entries = os.scandir("/proc")
     except OSError:
         return []
-    for entry in entries:
-        if not entry.name.isdigit():
-            continue
-        pid = int(entry.name)
-        if pid == os.getpid():
-            continue
-        if _is_hyperxalpha_cmdline(
-            _read_cmdline_tokens(pid),
-            launcher_tokens=launcher_tokens,
-        ):
-            pids.append(pid)
-    return sorted(set(pids))
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.isdigit():
+                continue
+            pid = int(name)
+            if pid == own_pid:
+                continue
+            if _is_hyperxalpha_cmdline_raw(
+                _read_cmdline_raw(name),
+                launcher_tokens=launcher_tokens,
+            ):
+                pids.add(pid)
+    return sorted(pids)
 
 
 def _wait_for_exit(pids, timeout_seconds):
+    try:
+        return _wait_for_exit_pidfd(pids, timeout_seconds)
+    except (AttributeError, OSError):
+        return _poll_for_exit(pids, timeout_seconds)
+
+
+def _wait_for_exit_pidfd(pids, timeout_seconds):
+    deadline = time.monotonic() + timeout_seconds
+    pidfds = {}
+    epoll = select.epoll()
+    try:
+        for pid in pids:
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue
+            pidfds[pidfd] = pid
+            epoll.register(pidfd, select.EPOLLIN)
+        while pidfds:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            for pidfd, _mask in epoll.poll(timeout):
+                epoll.unregister(pidfd)
+                os.close(pidfd)
+                del pidfds[pidfd]
+        return set(pidfds.values())
+    finally:
+        for pidfd in pidfds:
+            os.close(pidfd)
+        epoll.close()
+
+
+def _poll_for_exit(pids, timeout_seconds):
     remaining = set(pids)
     deadline = time.time() + timeout_seconds
     while remaining and time.time() < deadline:
@@ -294,11 +369,11 @@ def _wait_for_exit(pids, timeout_seconds):
     return remaining
 
 
-def _kill_running_app(receipt=None):
+def _kill_running_app(launcher_paths=()):
     if os.geteuid() != 0:
         return False, False
 
-    launcher_tokens = _candidate_launcher_tokens(receipt)
+    launcher_tokens = _candidate_launcher_tokens(launcher_paths)
     pids = _running_hyperxalpha_pids(launcher_tokens=launcher_tokens)
     if not pids:
         return False, True
@@ -411,85 +486,85 @@ def _candidate_runtime_roots(receipt):
     return sorted(set(safe_roots))
 
 
-def _collect_leftovers(receipt):
-    leftovers = []
-    udev_candidate = _candidate_udev_path(receipt)
-    if udev_candidate.exists():
-        leftovers.append(udev_candidate)
+@dataclass(frozen=True)
+class Candidates:
+    udev: Path
+    desktop: tuple
+    autostart: tuple
+    launchers: tuple
+    runtime_roots: tuple
 
-    for path in _candidate_desktop_paths(receipt):
-        if path.exists():
-            leftovers.append(path)
 
-    for path in _candidate_autostart_paths(receipt):
-        if path.exists():
-            leftovers.append(path)
-
-    for path in _candidate_launcher_paths(receipt):
-        if path.exists():
-            leftovers.append(path)
-
-    for path in _candidate_runtime_roots(receipt):
-        if path.exists():
-            leftovers.append(path)
+def _candidate_paths(receipt):
+    return Candidates(
+        udev=_candidate_udev_path(receipt),
+        desktop=tuple(_candidate_desktop_paths(receipt)),
+        autostart=tuple(_candidate_autostart_paths(receipt)),
+        launchers=tuple(_candidate_launcher_paths(receipt)),
+        runtime_roots=tuple(_candidate_runtime_roots(receipt)),
+    )
 
-    if RECEIPT_PATH.exists():
-        leftovers.append(RECEIPT_PATH)
 
-    return sorted(set(leftovers))
+def _existing_paths(paths):
+    return [path for path in paths if path.exists()]
 
 
 def uninstall():
     ok = True
     removed_any = False
     receipt = _read_receipt()
+    candidates = _candidate_paths(receipt)
+    removals = []
+    leftovers = set()
 
     if os.geteuid() != 0:
         print("Please run with sudo to remove installed system files.")
         ok = False
+        leftovers.update(
+            _existing_paths(
+                (candidates.udev, *candidates.launchers, *candidates.runtime_roots)
+            )
+        )
     else:
-        had_running, stopped = _kill_running_app(receipt=receipt)
+        had_running, stopped = _kill_running_app(candidates.launchers)
         if had_running and stopped:
             print("Stopped running HyperX Alpha instance.")
         elif had_running and not stopped:
             print("Cannot continue uninstall while HyperX Alpha is still running.")
             return 1
 
-        udev_path = _candidate_udev_path(receipt)
-        if _remove_file(udev_path):
+        udev_status = _remove_file(candidates.udev)
+        if udev_status == REMOVED:
             removed_any = True
             if not _reload_udev_rules():
                 ok = False
-
-        for launcher_path in _candidate_launcher_paths(receipt):
-            if _remove_file(launcher_path):
-                removed_any = True
-
-        for runtime_root in _candidate_runtime_roots(receipt):
-            if _remove_tree(runtime_root):
-                removed_any = True
-
-    for desktop_path in _candidate_desktop_paths(receipt):
-        if _remove_file(desktop_path):
+        elif udev_status == FAILED:
+            leftovers.add(candidates.udev)
+
+        removals.extend((_unlink, path) for path in candidates.launchers)
+        removals.extend((_rmtree, path) for path in candidates.runtime_roots)
+
+    removals.extend((_unlink, path) for path in candidates.desktop)
+    removals.extend((_unlink, path) for path in candidates.autostart)
+    results = _remove_paths(removals)
+    results.append((RECEIPT_PATH, _remove_file(RECEIPT_PATH)))
+    results.append((RELEASES_CACHE_PATH, _remove_file(RELEASES_CACHE_PATH)))
+    results.append((UPDATE_CHECK_PATH, _remove_file(UPDATE_CHECK_PATH)))
+    for path, status in results:
+        if status == REMOVED:
             removed_any = True
-
-    for autostart_path in _candidate_autostart_paths(receipt):
-        if _remove_file(autostart_path):
-            removed_any = True
-
-    if _remove_file(RECEIPT_PATH):
-        removed_any = True
+        elif status == FAILED:
+            leftovers.add(path)
 
     try:
         STATE_DIR.rmdir()
     except OSError:
         pass
 
-    leftovers = _collect_leftovers(receipt)
     if leftovers:
         ok = False
         print("Uninstall incomplete, leftover files:")
-        for path in leftovers:
+        for path in sorted(leftovers):
             print(f"  - {path}")
 
     if not removed_any: